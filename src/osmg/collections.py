@@ -14,6 +14,8 @@ Collections are designated containers of objects of a particular type.
 
 from __future__ import annotations
 from typing import Any
+from typing import ClassVar
+from typing import Optional
 from typing import TypeVar
 from dataclasses import dataclass, field
 import numpy as np
@@ -27,6 +29,7 @@ nparr = npt.NDArray[np.float64]
 
 TK = TypeVar('TK')
 TV = TypeVar('TV')
+TE = TypeVar('TE', bound=element.Element)
 
 
 @dataclass(repr=False)
@@ -37,6 +40,66 @@ class Collection(dict[TK, TV]):
         parent (Any)
     """
     parent: Any = field(repr=False)
+    # incremented whenever the contents of any collection change.
+    # Quantities derived from the contents of a model's collections
+    # can be cached and invalidated by comparing against it.
+    version: ClassVar[int] = 0
+    # maps attribute names to dictionaries of attribute values and
+    # the objects having them. Used by `retrieve_by_attr`.
+    attr_index: dict[str, dict[Any, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
+    def touch(self):
+        """
+        Registers a modification of the contents of the collection
+        """
+        Collection.version += 1
+        self.attr_index.clear()
+
+    def __setitem__(self, key, value):
+        self.touch()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.touch()
+        super().__delitem__(key)
+
+    def pop(self, key, *args):
+        """
+        Removes an object from the collection and returns it
+        """
+        self.touch()
+        return super().pop(key, *args)
+
+    def popitem(self):
+        """
+        Removes the last object added to the collection and
+        returns its (uid, object) pair
+        """
+        self.touch()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        """
+        Returns the object with the given uid, adding `default`
+        if it does not exist
+        """
+        self.touch()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        """
+        Adds the objects of another mapping to the collection
+        """
+        self.touch()
+        super().update(*args, **kwargs)
+
+    def clear(self):
+        """
+        Removes all objects from the collection
+        """
+        self.touch()
+        super().clear()
 
     def add(self, obj):
         """
@@ -52,13 +115,35 @@ class Collection(dict[TK, TV]):
         """
         Retrieve an object from the collection based on an attribute
         value
+        The objects are looked up in a dictionary of attribute values,
+        which is rebuilt after the collection is modified. Attributes
+        can still change after an object is added, so a match is
+        verified, and if none is found the collection is scanned.
+        Unhashable values are also looked up by scanning.
         """
         res = None
+        try:
+            index = self.attr_index.get(attr)
+            if index is None:
+                # if multiple objects share the value, the last one wins
+                index = {getattr(thing, attr): thing
+                         for thing in self.values() if hasattr(thing, attr)}
+                self.attr_index[attr] = index
+            res = index.get(val)
+        except TypeError:
+            # unhashable attribute values
+            pass
+        if res is not None and getattr(res, attr) == val:
+            return res
+        res = None
         for thing in self.values():
             if hasattr(thing, attr):
                 other_val = getattr(thing, attr)
                 if other_val == val:
                     res = thing
+        if res is not None:
+            # the dictionary is outdated
+            self.attr_index.pop(attr, None)
         return res
 
     def __srepr__(self):
@@ -90,8 +175,11 @@ class CollectionActive(Collection[TK, TV]):
             uids (list[int]): uids of the objects to set as active
         """
         for uid in uids:
-            assert uid in self
-        self.active = uids
+            if uid not in self:
+                raise ValueError(f'Object uid does not exist: {uid}')
+        # duplicates are dropped, so that the generators don't
+        # attempt to define the same objects twice
+        self.active = list(dict.fromkeys(uids))
 
     def set_active_all(self):
         """
@@ -99,39 +187,128 @@ class CollectionActive(Collection[TK, TV]):
         Args:
             uids (list[int]): uids of the objects to set as active
         """
-        self.active = []
-        for key in self:
-            self.active.append(key)
+        self.active = list(self)
 
 
 @dataclass(repr=False)
 class NodeCollection(Collection[int, node.Node]):
     """
     Node collection.
+    Nodes are also indexed by their quantized plan coordinates, so
+    that searching for a node at a given location does not require
+    scanning the entire collection.
     Attributes:
         parent (Any)
     """
     named_contents: dict[str, node.Node] = field(default_factory=dict)
+    xy_index: dict[tuple[int, ...], list[node.Node]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    num_indexed: int = field(
+        default=0, init=False, repr=False, compare=False)
+    coords_cache: Optional[nparr] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def add(self, obj):
+        """
+        Add a node to the collection
+        """
+        super().add(obj)
+        self.coords_cache = None
+        if self.num_indexed == len(self) - 1:
+            self.index_node(obj)
+
+    def coords_array(self) -> nparr:
+        """
+        Returns the coordinates of all nodes as an (N, 3) array,
+        in the order of the collection's values. The array is cached
+        and only rebuilt after nodes are added.
+        """
+        if self.coords_cache is None or \
+                len(self.coords_cache) != len(self):
+            self.coords_cache = np.array(
+                [nde.coords for nde in self.values()],
+                dtype=float).reshape(-1, 3)
+        return self.coords_cache
+
+    def index_node(self, nde: node.Node):
+        """
+        Adds a node to the plan coordinate index
+        """
+        key = common.quantize(nde.coords[:2])
+        self.xy_index.setdefault(key, []).append(nde)
+        self.num_indexed += 1
+
+    def candidates_xy(self, x_coord, y_coord) -> list[node.Node]:
+        """
+        Returns the nodes that might be located within
+        `common.EPSILON` of the given point in plan view.
+        """
+        if self.num_indexed != len(self):
+            # nodes were added without going through `add`
+            self.xy_index = {}
+            self.num_indexed = 0
+            for nde in self.values():
+                self.index_node(nde)
+        i_x, i_y = common.quantize((x_coord, y_coord))
+        res: list[node.Node] = []
+        for d_x in (-1, 0, 1):
+            for d_y in (-1, 0, 1):
+                res.extend(self.xy_index.get((i_x + d_x, i_y + d_y), ()))
+        return res
 
     def search_xy(self, x_coord, y_coord):
         """
         Returns the node that occupies a given point if it exists
         """
 
-        candidate_pt: nparr = np.array(
-            [x_coord, y_coord, self.parent.elevation])
-        for other_node in self.values():
-            other_pt: nparr = np.array(other_node.coords)
-            if np.linalg.norm(candidate_pt - other_pt) < common.EPSILON:
+        candidate_pt = (x_coord, y_coord, self.parent.elevation)
+        for other_node in self.candidates_xy(x_coord, y_coord):
+            if common.points_coincide(candidate_pt, other_node.coords):
                 return other_node
         # indent the following line once to the right, and you'll be
         # spending a couple of nights trying to figure out why there
         # are so many duplicate nodes
         return None
 
+    def search_point(self, point) -> Optional[node.Node]:
+        """
+        Returns the node that occupies a given point in space if it
+        exists
+        """
+        for other_node in self.candidates_xy(point[0], point[1]):
+            if common.points_coincide(point, other_node.coords):
+                return other_node
+        return None
+
+    def __delitem__(self, key):
+        nde = self[key]
+        super().__delitem__(key)
+        self.discard_index(nde)
+
+    def pop(self, key, *args):
+        """
+        Removes a node from the collection and returns it
+        """
+        if key not in self:
+            return super().pop(key, *args)
+        nde = super().pop(key)
+        self.discard_index(nde)
+        return nde
+
+    def discard_index(self, nde: node.Node):
+        """
+        Removes a node from the plan coordinate index and
+        invalidates the cached coordinates
+        """
+        self.coords_cache = None
+        bucket = self.xy_index.get(common.quantize(nde.coords[:2]))
+        if bucket is not None and nde in bucket:
+            bucket.remove(nde)
+            self.num_indexed -= 1
+
 
 @dataclass(repr=False)
-class CollectionWithConnectivity(Collection[TK, TV]):
+class CollectionWithConnectivity(Collection[TK, TE]):
     """
     Collection of elements for which it is important to consider their
     connectivity.
@@ -142,6 +319,9 @@ class CollectionWithConnectivity(Collection[TK, TV]):
         str, element.ElasticBeamColumn] = field(
             default_factory=dict)
 
+    connectivity: dict[tuple[int, ...], Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
     def add(self, elm):
         """
         Adds an element to the collection.
@@ -149,9 +329,57 @@ class CollectionWithConnectivity(Collection[TK, TV]):
         connectivity exists in the collection, and raises an error if
         it does.
         """
-        uids = [nd.uid for nd in elm.nodes]
-        uids.sort()
-        uids_tuple = (*uids,)
-        if uids_tuple in elm.parent_component.element_connectivity():
-            raise ValueError('This should never happen!')
+        uids_tuple = common.connectivity_key(elm.nodes)
+        component = elm.parent_component
+        for collection in (component.elastic_beamcolumn_elements,
+                           component.disp_beamcolumn_elements):
+            if uids_tuple in collection.element_connectivity():
+                raise ValueError('This should never happen!')
         super().add(elm)
+        self.connectivity[uids_tuple] = elm
+
+    def element_connectivity(self) -> dict[tuple[int, ...], Any]:
+        """
+        Returns a dictionary having the tuples of the uids of the
+        nodes of the elements in ascending order as keys, and the
+        elements as values.
+        """
+        if len(self.connectivity) != len(self):
+            # elements were added without going through `add`
+            self.connectivity = {}
+            for elm in self.values():
+                self.connectivity[common.connectivity_key(elm.nodes)] = elm
+        return self.connectivity
+
+    def __delitem__(self, key):
+        elm = self[key]
+        super().__delitem__(key)
+        self.discard_connectivity(elm)
+
+    def pop(self, key, *args):
+        """
+        Removes an element from the collection and returns it
+        """
+        if key not in self:
+            return super().pop(key, *args)
+        elm = super().pop(key)
+        self.discard_connectivity(elm)
+        return elm
+
+    def reconnect(self, elm, nodes):
+        """
+        Changes the nodes of an element of the collection, keeping
+        the connectivity dictionary up to date
+        """
+        self.touch()
+        self.discard_connectivity(elm)
+        elm.nodes = nodes
+        self.connectivity[common.connectivity_key(nodes)] = elm
+
+    def discard_connectivity(self, elm):
+        """
+        Removes an element from the connectivity dictionary
+        """
+        uids_tuple = common.connectivity_key(elm.nodes)
+        if self.connectivity.get(uids_tuple) is elm:
+            del self.connectivity[uids_tuple]
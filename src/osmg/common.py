@@ -11,6 +11,7 @@ Common definitions
 #
 # https://github.com/ioannis-vm/OpenSees_Model_Generator
 
+import math
 from pprint import pprint
 from typing import OrderedDict
 from typing import Any
@@ -54,6 +55,42 @@ def print_dir(obj: object):
     pprint(dir(obj))
 
 
+def quantize(coords, quantum: float = EPSILON) -> tuple[int, ...]:
+    """
+    Maps a point to a tuple of integers that can be used as a hash
+    key. Points closer than `quantum` to each other end up either
+    in the same or in adjacent cells.
+    """
+    return tuple(math.floor(coord / quantum) for coord in coords)
+
+
+def connectivity_key(nodes) -> tuple[int, ...]:
+    """
+    Returns the uids of the given nodes in ascending order, used as
+    a hash key representing their connectivity. Pairs of nodes, by
+    far the most common case, are ordered with a single comparison.
+    """
+    if len(nodes) == 2:
+        uid_1 = nodes[0].uid
+        uid_2 = nodes[1].uid
+        return (uid_1, uid_2) if uid_1 < uid_2 else (uid_2, uid_1)
+    return tuple(sorted(nde.uid for nde in nodes))
+
+
+def points_coincide(pt_1, pt_2, tolerance: float = EPSILON) -> bool:
+    """
+    Checks if two points are closer than `tolerance` to each other.
+    Uses scalar arithmetic on the squared distance to avoid
+    allocating arrays. If the points have a different number of
+    coordinates, only the common ones are considered.
+    """
+    dist_sq = 0.00
+    for coord_1, coord_2 in zip(pt_1, pt_2):
+        diff = coord_1 - coord_2
+        dist_sq += diff * diff
+    return dist_sq < tolerance * tolerance
+
+
 def previous_element(dct: OrderedDict[Any, Any], key):
     """
     Returns the previous object in an OrderedDict
@@ -61,13 +98,12 @@ def previous_element(dct: OrderedDict[Any, Any], key):
     If it is not, it returns None.
     If the target key is the first object, it returns None.
     """
-    if key in dct:
-        key_list = list(dct.keys())
-        idx = key_list.index(key)
-        if idx == 0:
-            ans = None
-        else:
-            ans = dct[key_list[idx-1]]
-    else:
-        ans = None
+    if key not in dct:
+        return None
+    # single pass over the items, stopping at the target key
+    ans = None
+    for other_key, val in dct.items():
+        if other_key == key:
+            break
+        ans = val
     return ans
@@ -92,48 +92,44 @@ class ComponentAssembly:
         Returns a dictionary of all ElasticBeamColumn objects in the model.
         The keys are the uids of the objects.
         """
-        res = {}
-        for elm in self.elastic_beamcolumn_elements.values():
-            res[elm.uid] = elm
-        return res
+        return dict(self.elastic_beamcolumn_elements)
 
     def list_of_elastic_beamcolumn_elements(self):
         """
         Returns a list of all ElasticBeamColumn objects in the model.
         """
-        return list(self.dict_of_elastic_beamcolumn_elements().values())
+        return list(self.elastic_beamcolumn_elements.values())
 
     def dict_of_disp_beamcolumn_elements(self):
         """
         Returns a dictionary of all DispBeamColumn objects in the model.
         The keys are the uids of the objects.
         """
-        res = {}
-        for elm in self.disp_beamcolumn_elements.values():
-            res[elm.uid] = elm
-        return res
+        return dict(self.disp_beamcolumn_elements)
 
     def list_of_disp_beamcolumn_elements(self):
         """
         Returns a list of all DispBeamColumn objects in the model.
         """
-        return list(self.dict_of_disp_beamcolumn_elements().values())
+        return list(self.disp_beamcolumn_elements.values())
 
     def dict_of_beamcolumn_elements(self):
         """
         Returns a dictionary of all beamcolumn elements in the model.
         The keys are the uids of the objects.
         """
-        res = {}
-        res.update(self.dict_of_elastic_beamcolumn_elements())
-        res.update(self.dict_of_disp_beamcolumn_elements())
+        res: dict[
+            int, element.ElasticBeamColumn | element.DispBeamColumn] = {}
+        res.update(self.elastic_beamcolumn_elements)
+        res.update(self.disp_beamcolumn_elements)
         return res
 
     def list_of_all_elements(self):
         """
         Returns a list of all beamcolumn elements in the model.
         """
-        return list(self.dict_of_beamcolumn_elements().values())
+        return (list(self.elastic_beamcolumn_elements.values())
+                + list(self.disp_beamcolumn_elements.values()))
 
     def element_connectivity(self):
         """
@@ -144,10 +140,6 @@ class ComponentAssembly:
         tuples as keys, and the associated components as values.
         """
         res = {}
-        elms = self.list_of_all_elements()
-        for elm in elms:
-            uids = [nd.uid for nd in elm.nodes]
-            uids.sort()
-            uids_tuple = (*uids,)
-            res[uids_tuple] = elm
+        res.update(self.elastic_beamcolumn_elements.element_connectivity())
+        res.update(self.disp_beamcolumn_elements.element_connectivity())
         return res
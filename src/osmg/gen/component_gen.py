@@ -19,7 +19,10 @@ from typing import TYPE_CHECKING
 from typing import Type
 from typing import Union
 from typing import Callable
+from typing import Optional
+from typing import Any
 from dataclasses import dataclass, field
+import math
 import numpy as np
 import numpy.typing as npt
 from ..ops.node import Node
@@ -36,7 +39,6 @@ from ..ops.section import ElasticSection
 from ..ops.section import FiberSection
 from ..preprocessing.split_component import split_component
 from ..transformations import local_axes_from_points_and_angle
-from ..transformations import transformation_matrix
 from ..defaults import load_util_rigid_elastic
 from ..gen.zerolength_gen import steel_w_col_pz
 from ..gen.zerolength_gen import fix_all
@@ -49,6 +51,14 @@ if TYPE_CHECKING:
 
 nparr = npt.NDArray[np.float64]
 
+# snap keywords for connecting to a steel W panel zone, either at one
+# of its external nodes or at a snap point of its interior section
+PZ_NODE_SNAPS = frozenset((
+    'middle_front', 'middle_back', 'top_node', 'bottom_node'))
+PZ_SECTION_SNAPS = frozenset((
+    'centroid', 'top_center', 'top_left', 'top_right', 'center_left',
+    'center_right', 'bottom_center', 'bottom_left', 'bottom_right'))
+
 
 def retrieve_snap_pt_global_offset(placement, section, p_i, p_j, angle):
     """
@@ -58,15 +68,12 @@ def retrieve_snap_pt_global_offset(placement, section, p_i, p_j, angle):
     if section.snap_points and (placement != 'centroid'):
         # obtain offset from section (local system)
         d_z, d_y = section.snap_points[placement]
-        sec_offset_local: nparr = np.array([0.00, d_y, d_z])
         # retrieve local coordinate system
-        x_axis, y_axis, z_axis = \
+        _, y_axis, z_axis = \
             local_axes_from_points_and_angle(
                 p_i, p_j, angle)
-        t_glob_to_loc = transformation_matrix(
-            x_axis, y_axis, z_axis)
-        t_loc_to_glob = t_glob_to_loc.T
-        sec_offset_global = t_loc_to_glob @ sec_offset_local
+        # local to global transformation of (0.00, d_y, d_z)
+        sec_offset_global = y_axis * d_y + z_axis * d_z
     else:
         sec_offset_global = np.zeros(3)
     return sec_offset_global
@@ -97,30 +104,21 @@ def beam_placement_lookup(
         components = query.retrieve_components_from_nodes([node], lvl.uid)
         for component in components.values():
             if component.component_purpose == 'steel_W_panel_zone':
-                if snap in ['middle_front', 'middle_back',
-                            'top_node', 'bottom_node']:
+                if snap in PZ_NODE_SNAPS:
                     result_node = component.external_nodes.named_contents[snap]
                     e_o += np.array(
                         (0.00, 0.00, node.coords[2] - result_node.coords[2]))
                     node = result_node
                     return node, e_o
-                if snap in [
-                        'centroid', 'top_center', 'top_left',
-                        'top_right', 'center_left', 'center_right',
-                        'bottom_center', 'bottom_left', 'bottom_right']:
+                if snap in PZ_SECTION_SNAPS:
                     elm = component.elastic_beamcolumn_elements.named_contents[
                         'elm_interior']
                     d_z, d_y = elm.section.snap_points[snap]
-                    sec_offset_local: nparr = -np.array([0.00, d_y, d_z])
-                    # retrieve local coordinate system
-                    x_axis = elm.geomtransf.x_axis
-                    y_axis = elm.geomtransf.y_axis
-                    z_axis = elm.geomtransf.z_axis
-                    t_glob_to_loc = transformation_matrix(
-                        x_axis, y_axis, z_axis)
-                    t_loc_to_glob = t_glob_to_loc.T
-                    sec_offset_global = (
-                        t_loc_to_glob @ sec_offset_local)
+                    # local to global transformation of
+                    # -(0.00, d_y, d_z)
+                    sec_offset_global = -(
+                        elm.geomtransf.y_axis * d_y
+                        + elm.geomtransf.z_axis * d_z)
                     result_node = node
                     e_o += sec_offset_global
                     return node, e_o
@@ -134,12 +132,9 @@ def beam_placement_lookup(
                 column = query.search_connectivity(
                     [node, node_below])
                 if column:
-                    elms = []
-                    for dctkey in column.element_connectivity().keys():
-                        if node.uid in dctkey:
-                            elms.append(
-                                column
-                                .element_connectivity()[dctkey])
+                    elms = [elm for dctkey, elm
+                            in column.element_connectivity().items()
+                            if node.uid in dctkey]
                     assert elms, 'There should be an element here.'
                     assert len(elms) == 1, \
                         'There should only be one element here.'
@@ -147,17 +142,10 @@ def beam_placement_lookup(
                     # obtain offset from section (local system)
                     if elm.section.snap_points:
                         d_z, d_y = elm.section.snap_points[snap]
-                        sec_offset_local = -np.array([0.00, d_y, d_z])
-                        # retrieve local coordinate system
-                        x_axis = elm.geomtransf.x_axis
-                        y_axis = elm.geomtransf.y_axis
-                        z_axis = elm.geomtransf.z_axis
-                        t_glob_to_loc = transformation_matrix(
-                            x_axis, y_axis, z_axis)
-                        t_loc_to_glob = t_glob_to_loc.T
-                        sec_offset_global = (
-                            t_loc_to_glob @ sec_offset_local)
-                        e_o += sec_offset_global
+                        # local to global transformation of
+                        # -(0.00, d_y, d_z)
+                        e_o -= (elm.geomtransf.y_axis * d_y
+                                + elm.geomtransf.z_axis * d_z)
         # else:
         #     raise ValueError(
         #         'Error: existing node without any elements to connect to.')
@@ -317,72 +305,55 @@ class BeamColumnGenerator:
         Adds beamcolumn elemens in series
         """
 
+        intnodes = []
         if n_sub > 1:
             p_i = np.array(node_i.coords) + eo_i
             p_j = np.array(node_j.coords) + eo_j
-            clear_len = np.linalg.norm(p_j - p_i)
-            internal_pt_coords = np.linspace(
-                tuple(p_i),
-                tuple(p_j),
-                num=n_sub+1)
+            delta = p_j - p_i
+            t_vals = np.linspace(0.00, 1.00, num=n_sub+1)
+            internal_pt_coords = p_i + np.multiply.outer(t_vals, delta)
 
             # initial deformation
-            t_vals = np.linspace(0.00, 1.00, num=n_sub+1)
-            # quadratic initial imperfection
-            # offset_vals = 4.00 * (-t_vals**2 + t_vals)
-            # sinusoidal initial imperfection
-            offset_vals = np.sin(np.pi * t_vals)
-            offset_2 = offset_vals * camber_2 * clear_len
-            offset_3 = offset_vals * camber_3 * clear_len
-            camber_offset: nparr = np.column_stack((
-                np.zeros(n_sub+1),
-                offset_2,
-                offset_3
-            ))
-            x_axis, y_axis, z_axis = \
-                local_axes_from_points_and_angle(
-                    p_i, p_j, angle)
-            t_glob_to_loc = transformation_matrix(
-                x_axis, y_axis, z_axis)
-            t_loc_to_glob = t_glob_to_loc.T
-            camber_offset_global = (t_loc_to_glob @ camber_offset.T).T
-            internal_pt_coords += camber_offset_global
-
-            intnodes = []
-            for i in range(1, len(internal_pt_coords)-1):
-                intnode = Node(self.model.uid_generator
-                               .new('node'),
-                               [*internal_pt_coords[i]])
+            if camber_2 != 0.00 or camber_3 != 0.00:
+                clear_len = np.linalg.norm(delta)
+                # quadratic initial imperfection
+                # offset_vals = 4.00 * (-t_vals**2 + t_vals)
+                # sinusoidal initial imperfection
+                offset_vals = np.sin(np.pi * t_vals) * clear_len
+                _, y_axis, z_axis = \
+                    local_axes_from_points_and_angle(
+                        p_i, p_j, angle)
+                # local (0, offset_2, offset_3) offsets expressed in
+                # the global coordinate system
+                internal_pt_coords += np.multiply.outer(
+                    offset_vals, camber_2 * y_axis + camber_3 * z_axis)
+
+            uids = self.model.uid_generator.new_batch('node', n_sub - 1)
+            for uid, coords in zip(uids, internal_pt_coords[1:-1]):
+                intnode = Node(uid, [*coords])
                 component.internal_nodes.add(intnode)
                 intnodes.append(intnode)
+        if element_type.__name__ == 'ElasticBeamColumn':
+            elm_collection = component.elastic_beamcolumn_elements
+        elif element_type.__name__ == 'DispBeamColumn':
+            elm_collection = component.disp_beamcolumn_elements
+        else:
+            raise TypeError(
+                'Unsupported element type:'
+                f' {element_type.__name__}')
+        # consecutive pairs of nodes define the elements
+        series_nodes = [node_i, *intnodes, node_j]
         for i in range(n_sub):
-            if i == 0:
-                n_i = node_i
-                o_i = eo_i
-            else:
-                n_i = intnodes[i-1]
-                o_i = np.zeros(3)
-            if i == n_sub - 1:
-                n_j = node_j
-                o_j = eo_j
-            else:
-                n_j = intnodes[i]
-                o_j = np.zeros(3)
             element = self.define_beamcolumn(
                 assembly=component,
-                node_i=n_i, node_j=n_j,
-                offset_i=o_i, offset_j=o_j, transf_type=transf_type,
+                node_i=series_nodes[i], node_j=series_nodes[i+1],
+                offset_i=eo_i if i == 0 else np.zeros(3),
+                offset_j=eo_j if i == n_sub - 1 else np.zeros(3),
+                transf_type=transf_type,
                 section=section,
                 element_type=element_type,
                 angle=angle)
-            if element_type.__name__ == 'ElasticBeamColumn':
-                component.elastic_beamcolumn_elements.add(element)
-            elif element_type.__name__ == 'DispBeamColumn':
-                component.disp_beamcolumn_elements.add(element)
-            else:
-                raise TypeError(
-                    'Unsupported element type:'
-                    f' {element_type.__name__}')
+            elm_collection.add(element)
 
     def generate_plain_component_assembly(
             self,
@@ -432,6 +403,83 @@ class BeamColumnGenerator:
 
         return component
 
+    def define_hinge(
+            self,
+            component,
+            end,
+            node,
+            eo,
+            hinge_location,
+            x_axis,
+            y_axis,
+            section,
+            element_type,
+            transf_type,
+            angle,
+            zerolength_gen,
+            zerolength_gen_args):
+        """
+        Defines the nodes and elements of a hinge at the specified end
+        ('i' or 'j') of a hinged component assembly, connecting it to
+        the given external node. Returns the inner hinge node, to
+        which the rest of the component assembly is connected.
+        """
+        nh_out = Node(self.model.uid_generator.new('node'),
+                      [*hinge_location])
+        nh_in = Node(self.model.uid_generator.new('node'),
+                     [*hinge_location])
+        nh_in.visibility.connected_to_zerolength = True
+        component.internal_nodes.add(nh_out)
+        component.internal_nodes.add(nh_in)
+        # the segment between the external node and the hinge runs
+        # from the external node at end i, and towards it at end j
+        if end == 'i':
+            seg_nodes = (node, nh_out)
+            seg_offsets = (eo, np.zeros(3))
+            hinge_x_axis = x_axis
+        else:
+            seg_nodes = (nh_out, node)
+            seg_offsets = (np.zeros(3), eo)
+            hinge_x_axis = -x_axis
+        element_type_end = zerolength_gen_args.get(
+            'element_type', element_type)
+        if element_type_end.__name__ in (
+                'ElasticBeamColumn', 'DispBeamColumn'):
+            self.add_beamcolumn_elements_in_series(
+                component,
+                *seg_nodes,
+                *seg_offsets,
+                zerolength_gen_args['n_sub'],
+                zerolength_gen_args.get('transf_type', transf_type),
+                zerolength_gen_args.get('section', section),
+                element_type_end,
+                angle, 0.00, 0.00
+            )
+        elif element_type_end.__name__ == 'TwoNodeLink':
+            elm = self.define_two_node_link(
+                component,
+                *seg_nodes,
+                x_axis,
+                y_axis,
+                fix_all,
+                {}
+            )
+            component.twonodelink_elements.add(elm)
+        else:
+            raise ValueError(
+                f'Invalid element_type_{end}: {element_type_end}')
+        zerolen_elm = self.define_zerolength(
+            component,
+            nh_out,
+            nh_in,
+            hinge_x_axis,
+            y_axis,
+            zerolength_gen,
+            zerolength_gen_args
+        )
+        component.zerolength_elements.add(zerolen_elm)
+        return nh_in
+
     def generate_hinged_component_assembly(
             self,
             component_purpose,
@@ -472,138 +520,29 @@ class BeamColumnGenerator:
         axes = local_axes_from_points_and_angle(
             p_i, p_j, angle)
         x_axis, y_axis, _ = axes
-        clear_length = np.linalg.norm(p_j - p_i)
+        clear_length = math.dist(p_j, p_i)
         zerolength_gen_args_i.update({'element_length': clear_length})
         zerolength_gen_args_j.update({'element_length': clear_length})
 
         # we can have hinges at both ends, or just one of the two ends.
         # ...or even no hinges!
         if zerolength_gen_i:
-
-            hinge_location_i = p_i + x_axis * zerolength_gen_args_i['distance']
-            nh_i_out = Node(self.model.uid_generator.new('node'),
-                            [*hinge_location_i])
-            nh_i_in = Node(self.model.uid_generator.new('node'),
-                           [*hinge_location_i])
-            nh_i_in.visibility.connected_to_zerolength = True
-            component.internal_nodes.add(nh_i_out)
-            component.internal_nodes.add(nh_i_in)
-            if 'element_type' in zerolength_gen_args_i:
-                element_type_i = zerolength_gen_args_i['element_type']
-            else:
-                element_type_i = element_type
-            if element_type_i.__name__ in (
-                    'ElasticBeamColumn', 'DispBeamColumn'):
-                if 'section' in zerolength_gen_args_i:
-                    section_i = zerolength_gen_args_i['section']
-                else:
-                    section_i = section
-                if 'transf_type' in zerolength_gen_args_i:
-                    transf_type_i = zerolength_gen_args_i['transf_type']
-                else:
-                    transf_type_i = transf_type
-                self.add_beamcolumn_elements_in_series(
-                    component,
-                    node_i,
-                    nh_i_out,
-                    eo_i,
-                    np.zeros(3),
-                    zerolength_gen_args_i['n_sub'],
-                    transf_type_i,
-                    section_i,
-                    element_type_i,
-                    angle, 0.00, 0.00
-                )
-            elif element_type_i.__name__ == 'TwoNodeLink':
-                elm = self.define_two_node_link(
-                    component,
-                    node_i,
-                    nh_i_out,
-                    x_axis,
-                    y_axis,
-                    fix_all,
-                    {}
-                )
-                component.twonodelink_elements.add(elm)
-            else:
-                raise ValueError(f'Invalid element_type_i: {element_type_i}')
-            zerolen_elm = self.define_zerolength(
-                component,
-                nh_i_out,
-                nh_i_in,
-                x_axis,
-                y_axis,
-                zerolength_gen_i,
-                zerolength_gen_args_i
-            )
-            component.zerolength_elements.add(zerolen_elm)
-            conn_node_i = nh_i_in
+            conn_node_i = self.define_hinge(
+                component, 'i', node_i, eo_i,
+                p_i + x_axis * zerolength_gen_args_i['distance'],
+                x_axis, y_axis, section, element_type, transf_type, angle,
+                zerolength_gen_i, zerolength_gen_args_i)
             conn_eo_i = np.zeros(3)
         else:
             conn_node_i = node_i
             conn_eo_i = eo_i
         if zerolength_gen_j:
-
-            hinge_location_j = (p_i + x_axis *
-                                (clear_length
-                                 - zerolength_gen_args_j['distance']))
-            nh_j_out = Node(self.model.uid_generator.new('node'),
-                            [*hinge_location_j])
-            nh_j_in = Node(self.model.uid_generator.new('node'),
-                           [*hinge_location_j])
-            nh_j_in.visibility.connected_to_zerolength = True
-            component.internal_nodes.add(nh_j_out)
-            component.internal_nodes.add(nh_j_in)
-            if 'element_type' in zerolength_gen_args_j:
-                element_type_j = zerolength_gen_args_j['element_type']
-            else:
-                element_type_j = element_type
-            if element_type_j.__name__ in (
-                    'ElasticBeamColumn', 'DispBeamColumn'):
-                if 'section' in zerolength_gen_args_j:
-                    section_j = zerolength_gen_args_j['section']
-                else:
-                    section_j = section
-                if 'transf_type' in zerolength_gen_args_j:
-                    transf_type_j = zerolength_gen_args_j['transf_type']
-                else:
-                    transf_type_j = transf_type
-                self.add_beamcolumn_elements_in_series(
-                    component,
-                    nh_j_out,
-                    node_j,
-                    np.zeros(3),
-                    eo_j,
-                    zerolength_gen_args_j['n_sub'],
-                    transf_type_j,
-                    section_j,
-                    element_type_j,
-                    angle, 0.00, 0.00
-                )
-            elif element_type_j.__name__ == 'TwoNodeLink':
-                elm = self.define_two_node_link(
-                    component,
-                    nh_j_out,
-                    node_j,
-                    x_axis,
-                    y_axis,
-                    fix_all,
-                    {}
-                )
-                component.twonodelink_elements.add(elm)
-            else:
-                raise ValueError(f'Invalid element_type_j: {element_type_j}')
-            zerolen_elm = self.define_zerolength(
-                component,
-                nh_j_out,
-                nh_j_in,
-                -x_axis,
-                y_axis,
-                zerolength_gen_j,
-                zerolength_gen_args_j
-            )
-            component.zerolength_elements.add(zerolen_elm)
-            conn_node_j = nh_j_in
+            conn_node_j = self.define_hinge(
+                component, 'j', node_j, eo_j,
+                p_i + x_axis * (clear_length
+                                - zerolength_gen_args_j['distance']),
+                x_axis, y_axis, section, element_type, transf_type, angle,
+                zerolength_gen_j, zerolength_gen_args_j)
             conn_eo_j = np.zeros(3)
         else:
             conn_node_j = node_j
@@ -637,7 +576,7 @@ class BeamColumnGenerator:
             angle=0.00,
             camber_2=0.00, camber_3=0.00,
             method='generate_plain_component_assembly',
-            additional_args={}
+            additional_args: Optional[dict[str, Any]] = None
     ):
         """
         Adds a vertical beamcolumn element to all active levels.  This
@@ -649,7 +588,14 @@ class BeamColumnGenerator:
         query = ElmQuery(self.model)
         lvls = self.model.levels
         assert lvls.active, 'No active levels.'
+        assert hasattr(self, method), \
+            f'Method not available: {method}'
+        mthd = getattr(self, method)
         defined_component_assemblies: dict[int, ComponentAssembly] = {}
+        # the top node of a level is the bottom node of the next one,
+        # so it does not need to be searched for again.
+        prev_key = None
+        prev_top_node = None
         for key in lvls.active:
             lvl = lvls[key]
             if key-1 not in lvls:
@@ -659,9 +605,14 @@ class BeamColumnGenerator:
             if not top_node:
                 top_node = ndg.add_node_lvl(x_coord, y_coord, key)
 
-            bottom_node = query.search_node_lvl(x_coord, y_coord, key-1)
+            if prev_key == key-1:
+                bottom_node = prev_top_node
+            else:
+                bottom_node = query.search_node_lvl(x_coord, y_coord, key-1)
             if not bottom_node:
                 bottom_node = ndg.add_node_lvl(x_coord, y_coord, key-1)
+            prev_key = key
+            prev_top_node = top_node
 
             # check for a panel zone
             top_node = look_for_panel_zone(top_node, lvl, query)
@@ -670,8 +621,6 @@ class BeamColumnGenerator:
             p_j = np.array(bottom_node.coords) + offset_j
             sec_offset_global = retrieve_snap_pt_global_offset(
                 placement, section, p_i, p_j, angle)
-            p_i += sec_offset_global
-            p_j += sec_offset_global
             eo_i = offset_i + sec_offset_global
             eo_j = offset_j + sec_offset_global
 
@@ -691,10 +640,8 @@ class BeamColumnGenerator:
                 'camber_3': camber_3
             }
 
-            args.update(additional_args)
-            assert hasattr(self, method), \
-                f'Method not available: {method}'
-            mthd = getattr(self, method)
+            if additional_args:
+                args.update(additional_args)
             defined_component_assemblies[key] = mthd(**args)
         return defined_component_assemblies
 
@@ -718,7 +665,7 @@ class BeamColumnGenerator:
             split_existing_i=None,
             split_existing_j=None,
             method='generate_plain_component_assembly',
-            additional_args={}
+            additional_args: Optional[dict[str, Any]] = None
     ):
         """
         Adds a horizontal beamcolumn element to all active levels.
@@ -727,6 +674,9 @@ class BeamColumnGenerator:
         ndg = NodeGenerator(self.model)
         lvls = self.model.levels
         assert lvls.active, 'No active levels.'
+        assert hasattr(self, method), \
+            f'Method not available: {method}'
+        mthd = getattr(self, method)
         defined_component_assemblies: dict[int, ComponentAssembly] = {}
         for key in lvls.active:
             lvl = lvls[key]
@@ -734,20 +684,8 @@ class BeamColumnGenerator:
             p_i_init = np.array((xi_coord, yi_coord, lvl.elevation)) + offset_i
             p_j_init = np.array((xj_coord, yj_coord, lvl.elevation)) + offset_j
 
-            if section.snap_points and (placement != 'centroid'):
-                # obtain offset from section (local system)
-                d_z, d_y = section.snap_points[placement]
-                sec_offset_local: nparr = np.array([0.00, d_y, d_z])
-                # retrieve local coordinate system
-                x_axis, y_axis, z_axis = \
-                    local_axes_from_points_and_angle(
-                        p_i_init, p_j_init, angle)  # type: ignore
-                t_glob_to_loc = transformation_matrix(
-                    x_axis, y_axis, z_axis)
-                t_loc_to_glob = t_glob_to_loc.T
-                sec_offset_global = t_loc_to_glob @ sec_offset_local
-            else:
-                sec_offset_global = np.zeros(3)
+            sec_offset_global = retrieve_snap_pt_global_offset(
+                placement, section, p_i_init, p_j_init, angle)
 
             node_i, eo_i = beam_placement_lookup(
                 xi_coord, yi_coord, query, ndg,
@@ -778,10 +716,8 @@ class BeamColumnGenerator:
                 'camber_3': camber_3
             }
 
-            args.update(additional_args)
-            assert hasattr(self, method), \
-                f'Method not available: {method}'
-            mthd = getattr(self, method)
+            if additional_args:
+                args.update(additional_args)
             defined_component_assemblies[key] = mthd(**args)
         return defined_component_assemblies
 
@@ -805,7 +741,7 @@ class BeamColumnGenerator:
             split_existing_i=None,
             split_existing_j=None,
             method='generate_plain_component_assembly',
-            additional_args={}
+            additional_args: Optional[dict[str, Any]] = None
     ):
         """
         Adds a diagonal beamcolumn element to all active levels.
@@ -814,6 +750,9 @@ class BeamColumnGenerator:
         ndg = NodeGenerator(self.model)
         lvls = self.model.levels
         assert lvls.active, 'No active levels.'
+        assert hasattr(self, method), \
+            f'Method not available: {method}'
+        mthd = getattr(self, method)
         defined_component_assemblies: dict[int, ComponentAssembly] = {}
         for key in lvls.active:
             lvl = lvls[key]
@@ -825,20 +764,8 @@ class BeamColumnGenerator:
             p_i_init = np.array((xi_coord, yi_coord, lvl.elevation)) + offset_i
             p_j_init = np.array((xj_coord, yj_coord, lvl.elevation)) + offset_j
 
-            if section.snap_points and (placement != 'centroid'):
-                # obtain offset from section (local system)
-                d_z, d_y = section.snap_points[placement]
-                sec_offset_local: nparr = np.array([0.00, d_y, d_z])
-                # retrieve local coordinate system
-                x_axis, y_axis, z_axis = \
-                    local_axes_from_points_and_angle(
-                        p_i_init, p_j_init, angle)  # type: ignore
-                t_glob_to_loc = transformation_matrix(
-                    x_axis, y_axis, z_axis)
-                t_loc_to_glob = t_glob_to_loc.T
-                sec_offset_global = t_loc_to_glob @ sec_offset_local
-            else:
-                sec_offset_global = np.zeros(3)
+            sec_offset_global = retrieve_snap_pt_global_offset(
+                placement, section, p_i_init, p_j_init, angle)
 
             node_i, eo_i = beam_placement_lookup(
                 xi_coord, yi_coord, query, ndg,
@@ -869,10 +796,8 @@ class BeamColumnGenerator:
                 'camber_3': camber_3
             }
 
-            args.update(additional_args)
-            assert hasattr(self, method), \
-                f'Method not available: {method}'
-            mthd = getattr(self, method)
+            if additional_args:
+                args.update(additional_args)
             defined_component_assemblies[key] = mthd(**args)
         return defined_component_assemblies
 
@@ -923,22 +848,17 @@ class BeamColumnGenerator:
                     p_i, p_j, angle)  # type: ignore
 
             # determine node locations
-            top_h_f_loc = p_i + y_axis * column_depth/2.00
-            top_h_b_loc = p_i - y_axis * column_depth/2.00
-            top_v_f_loc = p_i + y_axis * column_depth/2.00
-            top_v_b_loc = p_i - y_axis * column_depth/2.00
-            mid_v_f_loc = (p_i + y_axis * column_depth/2.00
-                           + x_axis * beam_depth/2.00)
-            mid_v_b_loc = (p_i - y_axis * column_depth/2.00
-                           + x_axis * beam_depth/2.00)
-            bottom_h_f_loc = (p_i + y_axis * column_depth/2.00
-                              + x_axis * beam_depth)
-            bottom_h_b_loc = (p_i - y_axis * column_depth/2.00
-                              + x_axis * beam_depth)
-            bottom_v_f_loc = (p_i + y_axis * column_depth/2.00
-                              + x_axis * beam_depth)
-            bottom_v_b_loc = (p_i - y_axis * column_depth/2.00
-                              + x_axis * beam_depth)
+            # (the offsets are computed once and shared between the
+            # horizontal and vertical nodes at each corner)
+            col_offset = y_axis * column_depth/2.00
+            mid_offset = x_axis * beam_depth/2.00
+            bottom_offset = x_axis * beam_depth
+            top_h_f_loc = top_v_f_loc = p_i + col_offset
+            top_h_b_loc = top_v_b_loc = p_i - col_offset
+            mid_v_f_loc = top_v_f_loc + mid_offset
+            mid_v_b_loc = top_v_b_loc + mid_offset
+            bottom_h_f_loc = bottom_v_f_loc = top_h_f_loc + bottom_offset
+            bottom_h_b_loc = bottom_v_b_loc = top_h_b_loc + bottom_offset
 
             # define nodes
             top_h_f = Node(
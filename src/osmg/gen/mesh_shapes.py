@@ -144,7 +144,20 @@ def rect_mesh(dim_b, dim_h):
         Vertex((dim_b/2., -dim_h/2.))
     ]
     edges = define_edges(vertices)
-    return generate(edges)
+    # The vertices are already ordered counterclockwise, so the
+    # internal loop is known in advance and the general loop
+    # detection of `generate` can be skipped.
+    halfedges = []
+    for edge in edges:
+        h_i = edge.define_halfedge(edge.v_i)
+        h_j = edge.define_halfedge(edge.v_j)
+        edge.v_i.halfedges.append(h_i)
+        edge.v_j.halfedges.append(h_j)
+        halfedges.append(h_i)
+    for i, edge in enumerate(edges):
+        edge.h_i.nxt = edges[(i + 1) % 4].h_i
+        edge.h_j.nxt = edges[i - 1].h_j
+    return Mesh(halfedges)
 
 
 def generic_snap_points(mesh: Mesh) -> dict[str, nparr]:
@@ -18,12 +18,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Union
 from typing import Optional
-from dataclasses import dataclass
+from typing import Iterable
+from dataclasses import dataclass, field
 import numpy as np
 import numpy.typing as npt
-from ..line import Line
 from ..load_case import LoadCase
 from .. import common
+from .. import collections
+from ..ops.element import end_points
 if TYPE_CHECKING:
     from ..component_assembly import ComponentAssembly
     from ..ops.element import ElasticBeamColumn
@@ -41,6 +43,12 @@ class ElmQuery:
     Used by all component generators
     """
     model: Model
+    # maps a level uid to the collection version at which its line
+    # elements were gathered, the components owning them, and their
+    # end points. Used by `retrieve_component`.
+    segment_cache: dict[int, tuple[
+        int, list[ComponentAssembly], nparr, nparr]] = field(
+            default_factory=dict, init=False, repr=False)
 
     def search_connectivity(
             self,
@@ -48,9 +56,7 @@ class ElmQuery:
         """
         find component assembly based on connectivity
         """
-        uids = [node.uid for node in nodes]
-        uids.sort()
-        uids_tuple = (*uids,)
+        uids_tuple = common.connectivity_key(nodes)
         conn_dict = self.model.component_connectivity()
         val = conn_dict.get(uids_tuple)
         return val
@@ -69,20 +75,19 @@ class ElmQuery:
         res = None
         # check to see if node exists
         if z_loc:
-            candidate_pt: nparr = np.array([x_loc, y_loc, z_loc])
-            ndims = 3
+            candidate_pt: tuple[float, ...] = (x_loc, y_loc, z_loc)
         else:
-            candidate_pt = np.array(
-                [x_loc, y_loc])
-            ndims = 2
-        nodes = level.nodes
+            candidate_pt = (x_loc, y_loc)
+        node_collections = [level.nodes]
         if internal:
             for comp in level.components.values():
-                nodes.update(comp.internal_nodes)
-        for other_node in nodes.values():
-            other_pt: nparr = np.array(other_node.coords[:ndims])
-            if np.linalg.norm(candidate_pt - other_pt) < common.EPSILON:
-                res = other_node
+                node_collections.append(comp.internal_nodes)
+        for nodes in node_collections:
+            for other_node in nodes.candidates_xy(x_loc, y_loc):
+                if common.points_coincide(candidate_pt, other_node.coords):
+                    res = other_node
+                    break
+            if res is not None:
                 break
         return res
 
@@ -97,18 +102,13 @@ class ElmQuery:
         retrieved_components = {}
         if lvl_uid:
             level = self.model.levels[lvl_uid]
-            candidate_components = level.components.values()
+            candidate_components: Iterable[ComponentAssembly] = (
+                level.components.values())
         else:
-            candidate_components = self.model.list_of_components()
-        given_node_uids = [n.uid for n in nodes]
+            candidate_components = self.model.iter_components()
+        given_node_uids = {n.uid for n in nodes}
         for component in candidate_components:
-            accept = False
-            external_nodes = component.external_nodes.values()
-            for node in external_nodes:
-                if node.uid in given_node_uids:
-                    accept = True
-                    continue
-            if accept:
+            if not given_node_uids.isdisjoint(component.external_nodes):
                 retrieved_components[component.uid] = component
         return retrieved_components
 
@@ -123,18 +123,13 @@ class ElmQuery:
         retrieved_component = None
         if lvl_uid:
             level = self.model.levels[lvl_uid]
-            candidate_components = level.components.values()
+            candidate_components: Iterable[ComponentAssembly] = (
+                level.components.values())
         else:
-            candidate_components = self.model.list_of_components()
-        given_node_uids = [n.uid for n in nodes]
+            candidate_components = self.model.iter_components()
+        given_node_uids = {n.uid for n in nodes}
         for component in candidate_components:
-            reject = False
-            external_nodes = component.external_nodes.values()
-            for node in external_nodes:
-                if node.uid not in given_node_uids:
-                    reject = True
-                    continue
-            if not reject:
+            if given_node_uids.issuperset(component.external_nodes):
                 retrieved_component = component
         return retrieved_component
 
@@ -144,30 +139,47 @@ class ElmQuery:
         beamcolumn elements passes trhough the specified point.
         Returns the first element found.
         """
-        level = self.model.levels[lvl]
-        for component in level.components.values():
-            if len(component.external_nodes) != 2:
-                continue
-            line_elems: list[Union[ElasticBeamColumn, DispBeamColumn]] = []
-            line_elems.extend(component.elastic_beamcolumn_elements
-                              .values())
-            line_elems.extend(component.disp_beamcolumn_elements
-                              .values())
-            for elm in line_elems:
-                p_i = (np.array(elm.nodes[0].coords)
-                       + elm.geomtransf.offset_i)
-                p_j = (np.array(elm.nodes[1].coords)
-                       + elm.geomtransf.offset_j)
-                if np.linalg.norm(p_i[0:2] - p_j[0:2]) < common.EPSILON:
-                    if np.linalg.norm(
-                            np.array((x_loc, y_loc))
-                            - p_i[0:2]) < common.EPSILON:
-                        return component
-                else:
-                    line = Line('', p_i[0:2], p_j[0:2])
-                    line.intersects_pt(np.array((x_loc, y_loc)))
-                    if line.intersects_pt(np.array((x_loc, y_loc))):
-                        return component
+        cached = self.segment_cache.get(lvl)
+        if cached is None or cached[0] != collections.Collection.version:
+            level = self.model.levels[lvl]
+            line_elems: list[
+                Union[ElasticBeamColumn, DispBeamColumn]] = []
+            owners: list[ComponentAssembly] = []
+            for component in level.components.values():
+                if len(component.external_nodes) != 2:
+                    continue
+                for elm_collection in (
+                        component.elastic_beamcolumn_elements,
+                        component.disp_beamcolumn_elements):
+                    line_elems.extend(elm_collection.values())
+                    owners.extend([component] * len(elm_collection))
+            if line_elems:
+                p_i, p_j = end_points(line_elems)
+            else:
+                p_i = p_j = np.empty((0, 3))
+            cached = (collections.Collection.version, owners, p_i, p_j)
+            self.segment_cache[lvl] = cached
+        _, owners, p_i, p_j = cached
+        if not owners:
+            return None
+        # test all elements at once, in plan view
+        r_a = p_j[:, 0:2] - p_i[:, 0:2]
+        r_b = np.array((x_loc, y_loc)) - p_i[:, 0:2]
+        norm2 = np.einsum('ij,ij->i', r_a, r_a)
+        # elements that are vertical in plan view only pass through
+        # their own location
+        vertical = np.sqrt(norm2) < common.EPSILON
+        norm2[vertical] = 1.00
+        cross = r_a[:, 0] * r_b[:, 1] - r_a[:, 1] * r_b[:, 0]
+        dot_normalized = np.einsum('ij,ij->i', r_a, r_b) / norm2
+        passes = np.where(
+            vertical,
+            np.sqrt(np.einsum('ij,ij->i', r_b, r_b)) < common.EPSILON,
+            (np.abs(cross) < common.EPSILON)
+            & (dot_normalized >= 0.00) & (dot_normalized <= 1.00))
+        if not np.any(passes):
+            return None
+        return owners[int(np.argmax(passes))]
 
 
 @dataclass
@@ -185,15 +197,14 @@ class LoadCaseQuery:
         mdl = self.model
         num_lvls = len(mdl.levels)
         distr = np.zeros(num_lvls)
+        node_mass = self.loadcase.node_mass
         for key, lvl in mdl.levels.items():
-            for node in lvl.nodes.values():
-                mass = self.loadcase.node_mass[node.uid]
-                distr[key] += mass.val[0]
-
+            uids = list(lvl.nodes)
             for component in lvl.components.values():
-                for node in component.internal_nodes.values():
-                    mass = self.loadcase.node_mass[node.uid]
-                    distr[key] += mass.val[0]
+                uids.extend(component.internal_nodes)
+            distr[key] += np.fromiter(
+                (node_mass[uid].val[0] for uid in uids),
+                dtype=float, count=len(uids)).sum()
         for uid, node in self.loadcase.parent_nodes.items():
             distr[uid] += self.loadcase.node_mass[node.uid].val[0]
         return distr
@@ -14,7 +14,9 @@ Model Generator for OpenSees ~ section generator
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Type
+from typing import Any
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 import pkgutil
 import numpy as np
@@ -31,6 +33,19 @@ if TYPE_CHECKING:
 nparr = npt.NDArray[np.float64]
 
 
+@lru_cache(maxsize=1)
+def _section_database() -> dict[str, dict[str, Any]]:
+    """
+    Parses the AISC steel section database.
+    The file is only read and parsed once.
+    """
+    filename = '../sections.json'
+    contents = pkgutil.get_data(__name__, filename)
+    assert isinstance(contents, bytes)
+    sections: dict[str, dict[str, Any]] = json.loads(contents)
+    return sections
+
+
 @dataclass(repr=False)
 class SectionGenerator:
     """
@@ -63,29 +78,10 @@ class SectionGenerator:
             sec_w=0.00,
         )
         if self.model.settings.imperial_units:
-            y_max = +10.00
-            y_min = -10.00
-            z_max = +6.00
-            z_min = -6.00
             sec.outside_shape = rect_mesh(12.0, 20.0)
         else:
-            y_max = +0.25
-            y_min = -0.25
-            z_max = +0.15
-            z_min = -0.15
             sec.outside_shape = rect_mesh(0.30, 0.50)
-        snap_points: dict[str, nparr] = {
-            'centroid': np.array([0., 0.]),
-            'top_center': np.array([0., -y_max]),
-            'top_left': np.array([-z_min, -y_max]),
-            'top_right': np.array([-z_max, -y_max]),
-            'center_left': np.array([-z_min, 0.]),
-            'center_right': np.array([-z_max, 0.]),
-            'bottom_center': np.array([0., -y_min]),
-            'bottom_left': np.array([-z_min, -y_min]),
-            'bottom_right': np.array([-z_max, -y_min])
-        }
-        sec.snap_points = snap_points
+        sec.snap_points = mesh_shapes.generic_snap_points(sec.outside_shape)
         self.model.elastic_sections.add(sec)
         return sec
 
@@ -104,15 +100,14 @@ class SectionGenerator:
             'name', ops_material)
         phs_mat = self.model.physical_materials.retrieve_by_attr(
             'name', physical_material)
-        filename = '../sections.json'
-        contents = pkgutil.get_data(__name__, filename)
-        assert isinstance(contents, bytes)
-        section_dictionary = json.loads(contents)
+        section_dictionary = _section_database()
         assert self.model.settings.imperial_units, 'SI not supported'
         returned_sections: dict[str, ElasticSection | FiberSection] = {}
         for label in labels:
             try:
-                sec_data = section_dictionary[label]
+                # copied, since the sections keep it as their
+                # `properties` and the database is shared
+                sec_data = dict(section_dictionary[label])
             except KeyError as exc:
                 raise KeyError(f'Section {label} not found in file.') from exc
             if sec_shape_designation == 'W':
@@ -124,19 +119,8 @@ class SectionGenerator:
                 area = sec_data['A']
                 outside_shape = mesh_shapes.w_mesh(
                     sec_b, sec_h, sec_tw, sec_tf, area)
-                bbox = outside_shape.bounding_box()
-                z_min, y_min, z_max, y_max = bbox.flatten()
-                snap_points: dict[str, nparr] = {
-                    'centroid': np.array([0., 0.]),
-                    'top_center': np.array([0., -y_max]),
-                    'top_left': np.array([-z_min, -y_max]),
-                    'top_right': np.array([-z_max, -y_max]),
-                    'center_left': np.array([-z_min, 0.]),
-                    'center_right': np.array([-z_max, 0.]),
-                    'bottom_center': np.array([0., -y_min]),
-                    'bottom_left': np.array([-z_min, -y_min]),
-                    'bottom_right': np.array([-z_max, -y_min])
-                }
+                snap_points: dict[str, nparr] = \
+                    mesh_shapes.generic_snap_points(outside_shape)
                 if sec_type.__name__ == 'FiberSection':
                     main_part = SectionComponent(
                         outside_shape,
@@ -188,19 +172,8 @@ class SectionGenerator:
                     sec_b, sec_ht)
                 hole = mesh_shapes.rect_mesh(
                     sec_b-2.00*sec_t, sec_ht-2.00*sec_t)
-                bbox = outside_shape.bounding_box()
-                z_min, y_min, z_max, y_max = bbox.flatten()
-                snap_points = {
-                    'centroid': np.array([0., 0.]),
-                    'top_center': np.array([0., -y_max]),
-                    'top_left': np.array([-z_min, -y_max]),
-                    'top_right': np.array([-z_max, -y_max]),
-                    'center_left': np.array([-z_min, 0.]),
-                    'center_right': np.array([-z_max, 0.]),
-                    'bottom_center': np.array([0., -y_min]),
-                    'bottom_left': np.array([-z_min, -y_min]),
-                    'bottom_right': np.array([-z_max, -y_min])
-                }
+                snap_points = \
+                    mesh_shapes.generic_snap_points(outside_shape)
                 if sec_type.__name__ == 'FiberSection':
                     main_part = SectionComponent(
                         outside_shape,
@@ -11,23 +11,32 @@ Model Generator for OpenSees ~ uid generator
 #
 # https://github.com/ioannis-vm/OpenSees_Model_Generator
 
-from dataclasses import dataclass
-from itertools import count
+from dataclasses import dataclass, field
 
 
 @dataclass
 class UIDGenerator:
     """
     Generates unique identifiers, uids, for various things.
+    Attributes:
+      next_uids (dict[str, int]): The uid that will be assigned next
+        for each kind of thing.
     """
+    next_uids: dict[str, int] = field(default_factory=dict)
 
-    def new(self, thing: str):
+    def new(self, thing: str) -> int:
         """
         Provide a uid for a new node
         """
-        if hasattr(self, thing):
-            res = next(getattr(self, thing))
-        else:
-            setattr(self, thing, count(0))
-            res = next(getattr(self, thing))
+        res = self.next_uids.get(thing, 0)
+        self.next_uids[thing] = res + 1
         return res
+
+    def new_batch(self, thing: str, num: int) -> range:
+        """
+        Reserves `num` consecutive uids at once, for cases where many
+        objects of the same kind are defined together.
+        """
+        start = self.next_uids.get(thing, 0)
+        self.next_uids[thing] = start + num
+        return range(start, start + num)
@@ -55,13 +55,8 @@ def interp_3d_deformation(element, u_i, r_i, u_j, r_j, num_points):
          deformed shape with extruded frame elements)
     """
 
-    x_vec: nparr = element.geomtransf.x_axis
-    y_vec: nparr = element.geomtransf.y_axis
-    z_vec: nparr = np.cross(x_vec, y_vec)
-
     # global -> local transformation matrix
-    transf_global2local = \
-        transformations.transformation_matrix(x_vec, y_vec, z_vec)
+    transf_global2local = element.geomtransf.glob_to_loc()
     transf_local2global = transf_global2local.T
 
     u_i_global = u_i
@@ -38,9 +38,10 @@ def add_data__nodes(data_dict, mdl, load_case):
     # I need to improve this code, avoid code repetition
     # TODO: merge this method with the other methods that plot nodes.
     list_of_nodes = mdl.list_of_primary_nodes()
-    x_list = [node.coords[0] for node in list_of_nodes]
-    y_list = [node.coords[1] for node in list_of_nodes]
-    z_list = [node.coords[2] for node in list_of_nodes]
+    coords = mdl.primary_coords_array()
+    x_list = coords[:, 0]
+    y_list = coords[:, 1]
+    z_list = coords[:, 2]
     customdata_lst = []
     restraints = [node.restraint for node in list_of_nodes]
     restraint_symbols = []
@@ -187,9 +188,13 @@ def add_data__internal_nodes(data_dict, mdl, load_case):
       load_case (LoadCase): the load_case to be visualized
     """
     list_of_nodes = mdl.list_of_internal_nodes()
-    x_list = [node.coords[0] for node in list_of_nodes]
-    y_list = [node.coords[1] for node in list_of_nodes]
-    z_list = [node.coords[2] for node in list_of_nodes]
+    coords: nparr = np.concatenate(
+        [np.empty((0, 3))]
+        + [component.internal_nodes.coords_array()
+           for component in mdl.list_of_components()])
+    x_list = coords[:, 0]
+    y_list = coords[:, 1]
+    z_list = coords[:, 2]
     customdata = []
     restraints = [node.restraint for node in list_of_nodes]
     restraint_symbols = []
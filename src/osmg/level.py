@@ -45,6 +45,19 @@ class Level:
         self.nodes = NodeCollection(self)
         self.components = Collection(self)
 
+    def __eq__(self, other):
+        # levels are compared by their uid, which is unique within
+        # a model, instead of field by field: the generated
+        # comparison would recursively compare the parent model and
+        # every node and component of the level.
+        if not isinstance(other, Level):
+            return NotImplemented
+        return (self.parent_model is other.parent_model
+                and self.uid == other.uid)
+
+    def __hash__(self):
+        return hash(self.uid)
+
     def __repr__(self):
         res = ''
         res += 'Level object\n'
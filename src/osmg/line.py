@@ -11,6 +11,7 @@ Model Generator for OpenSees ~ line
 #
 # https://github.com/ioannis-vm/OpenSees_Model_Generator
 
+import math
 from dataclasses import dataclass, field
 from typing import Optional
 import numpy as np
@@ -47,7 +48,7 @@ class Line:
         """
         returns the length of the line.
         """
-        return np.linalg.norm(self.end - self.start)
+        return math.hypot(*(self.end - self.start))
 
     def direction(self):
         """
@@ -61,60 +62,82 @@ class Line:
         Calculates the intersection point of this line with another line.
         Returns None if the lines don't intersect.
         Note: 'line' is actually a finite-length line segment.
+        The intersection point of the infinite lines passing through
+        the segments is only returned if it lies on both segments
+        (within `common.EPSILON`), otherwise None is returned.
+        Parallel lines are considered to intersect only if they
+        share an end point, which is returned.
         Parameters:
           other (Line): the other line
         """
-        ra_dir = self.direction()
-        rb_dir = other.direction()
-        mat: nparr = np.array(
-            [
-                [ra_dir[0], -rb_dir[0]],
-                [ra_dir[1], -rb_dir[1]]
-            ]
-        )
-        if np.abs(np.linalg.det(mat)) <= common.EPSILON:
+        # Most pairs of lines don't intersect. Those can be rejected
+        # quickly by checking the sides of the endpoints.
+        if (self.endpoints_on_same_side(other)
+                or other.endpoints_on_same_side(self)):
+            return None
+        ra_len = self.length()
+        rb_len = other.length()
+        ra_dir = (self.end - self.start) / ra_len
+        rb_dir = (other.end - other.start) / rb_len
+        # The 2x2 system is solved in closed form (Cramer's rule)
+        # using scalar arithmetic, which is considerably faster than
+        # calling the numpy linear algebra routines for such a small
+        # system.
+        determinant = float(-ra_dir[0] * rb_dir[1] + rb_dir[0] * ra_dir[1])
+        if abs(determinant) <= common.EPSILON:
             # The lines are parallel
             # in this case, we check if they have
             # a common starting or ending point
             # (we ignore the case of a common segment,
             #  as it has no practical use for our purposes).
-            if np.linalg.norm(self.start - other.start) <= common.EPSILON:
+            if math.dist(self.start, other.start) <= common.EPSILON:
                 result = self.start
-            elif np.linalg.norm(self.start - other.end) <= common.EPSILON:
+            elif math.dist(self.start, other.end) <= common.EPSILON:
                 result = self.start
-            elif np.linalg.norm(self.end - other.start) <= common.EPSILON:
+            elif math.dist(self.end, other.start) <= common.EPSILON:
                 result = self.end
-            elif np.linalg.norm(self.end - other.end) <= common. EPSILON:
+            elif math.dist(self.end, other.end) <= common.EPSILON:
                 result = self.end
             else:
                 result = None
+            return result
         # Get the origins
         ra_ori = self.start
         rb_ori = other.start
         # System left-hand-side
-        bvec: nparr = np.array(
-            [
-                [rb_ori[0] - ra_ori[0]],
-                [rb_ori[1] - ra_ori[1]],
-            ]
-        )
-        # Solve to get u and v in a vector
-        uvvec = np.linalg.solve(mat, bvec)
+        d_x = float(rb_ori[0] - ra_ori[0])
+        d_y = float(rb_ori[1] - ra_ori[1])
+        # Solve to get u and v
+        u_val = (-d_x * rb_dir[1] + rb_dir[0] * d_y) / determinant
+        v_val = (ra_dir[0] * d_y - ra_dir[1] * d_x) / determinant
         # Terminate if the intersection point
         # does not lie on both lines
-        if uvvec[0] < 0 - common.EPSILON:
-            result = None
-        if uvvec[1] < 0 - common.EPSILON:
-            result = None
-        if uvvec[0] > self.length() + common.EPSILON:
-            result = None
-        if uvvec[1] > other.length() + common.EPSILON:
-            result = None
+        if (u_val < 0 - common.EPSILON or v_val < 0 - common.EPSILON
+                or u_val > ra_len + common.EPSILON
+                or v_val > rb_len + common.EPSILON):
+            return None
         # Otherwise the point is valid
-        point = ra_ori + ra_dir * uvvec[0]
-        result = np.array([point[0], point[1]])
+        return np.array([ra_ori[0] + ra_dir[0] * u_val,
+                         ra_ori[1] + ra_dir[1] * u_val])
 
-        return result
+    def endpoints_on_same_side(self, other: 'Line') -> bool:
+        """
+        Checks if both endpoints of another line lie strictly on the
+        same side of the infinite line passing through this line, in
+        which case the two lines can't intersect.
+        Parameters:
+          other (Line): the other line
+        """
+        # normal vector (not normalized)
+        n_x = float(self.start[1] - self.end[1])
+        n_y = float(self.end[0] - self.start[0])
+        tolerance = common.EPSILON * math.hypot(n_x, n_y)
+        dist_start = (n_x * (other.start[0] - self.start[0])
+                      + n_y * (other.start[1] - self.start[1]))
+        dist_end = (n_x * (other.end[0] - self.start[0])
+                    + n_y * (other.end[1] - self.start[1]))
+        return bool((dist_start > tolerance and dist_end > tolerance)
+                    or (dist_start < -tolerance and dist_end < -tolerance))
 
     def intersects_pt(self, point: nparr) -> bool:
         """
@@ -148,7 +171,7 @@ class Line:
         r_b = point - self.start
         proj_point = (r_b @ r_a) / (r_a @ r_a) * r_a
         if self.intersects_pt(proj_point + self.start):
-            res: Optional[float] = float(np.linalg.norm(r_b - proj_point))
+            res: Optional[float] = math.hypot(*(r_b - proj_point))
         else:
             res = None
         return res
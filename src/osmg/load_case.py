@@ -18,7 +18,6 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 import numpy as np
 import numpy.typing as npt
-from . import transformations
 from . import collections
 from .preprocessing.tributary_area_analysis import TributaryAreaAnaysis
 from .preprocessing.rigid_diaphragm import RDAnalyzer
@@ -26,6 +25,7 @@ from .preprocessing.rigid_diaphragm import RDAnalyzer
 if TYPE_CHECKING:
     from .model import Model
     from .ops.element import ElasticBeamColumn
+    from .ops.element import DispBeamColumn
     from .ops.node import Node
 
 nparr = npt.NDArray[np.float64]
@@ -61,7 +61,7 @@ class LineElementUDL:
     Line element uniformly distributed load object.
     """
     parent_load_case: LoadCase
-    parent_line_element: ElasticBeamColumn
+    parent_line_element: ElasticBeamColumn | DispBeamColumn
     val: nparr = field(
         default_factory=lambda: np.zeros(shape=3))
 
@@ -101,28 +101,54 @@ class LineElementUDL:
             node_i_uid = elm.nodes[0].uid
             node_j_uid = elm.nodes[1].uid
             lcase = self.parent_load_case
-            lcase.node_loads[node_i_uid].add(
-                np.concatenate((force, np.zeros(3))))
-            lcase.node_loads[node_j_uid].add(
-                np.concatenate((force, np.zeros(3))))
+            lcase.node_loads[node_i_uid].val[:3] += force
+            lcase.node_loads[node_j_uid].val[:3] += force
         else:
-            transf_mat = transformations.transformation_matrix(
-                self.parent_line_element.geomtransf.x_axis,
-                self.parent_line_element.geomtransf.y_axis,
-                self.parent_line_element.geomtransf.z_axis)
-            udl_local = transf_mat @ udl
+            udl_local = self.glob_to_loc() @ udl
             self.val += udl_local
 
+    def glob_to_loc(self) -> nparr:
+        """
+        Returns the global to local transformation matrix of the
+        parent line element.
+        """
+        return self.parent_line_element.geomtransf.glob_to_loc()
+
     def to_global(self):
         """
         Returns the quantity expressed in the global coordinate system
         """
         udl = self.val
-        transf_mat = transformations.transformation_matrix(
-            self.parent_line_element.geomtransf.x_axis,
-            self.parent_line_element.geomtransf.y_axis,
-            self.parent_line_element.geomtransf.z_axis)
-        return transf_mat.T @ udl
+        return self.glob_to_loc().T @ udl
+
+
+def add_glob_udls(udls: list[LineElementUDL], vals: nparr):
+    """
+    Adds uniformly distributed loads defined with respect to the
+    global coordinate system to multiple line elements.
+    Equivalent to calling `add_glob` on each of them, but the
+    transformation to the local coordinate systems is performed for
+    all of them at once.
+    Args:
+        udls (list[LineElementUDL]): The UDL objects of the elements
+        vals (nparr): (N, 3) array containing the global UDL
+          components of each element
+    """
+    batch = []
+    batch_vals = []
+    for udl, val in zip(udls, vals):
+        if udl.parent_line_element.geomtransf.transf_type == 'Corotational':
+            # requires lumping, see `add_glob`
+            udl.add_glob(val)
+        else:
+            batch.append(udl)
+            batch_vals.append(val)
+    if not batch:
+        return
+    transf_mats = np.array([udl.glob_to_loc() for udl in batch])
+    udls_local = np.einsum('nij,nj->ni', transf_mats, np.array(batch_vals))
+    for udl, udl_local in zip(batch, udls_local):
+        udl.val += udl_local
 
 
 @dataclass(repr=False)
@@ -150,16 +176,34 @@ class LoadCase:
         self.line_element_udl = collections.Collection(self)
         self.tributary_area_analysis = \
             collections.Collection(self)
-        # initialize loads and mass for each node and element
-        for node in self.parent_model.list_of_all_nodes():
-            self.node_loads[node.uid] = PointLoadMass()
-            self.node_mass[node.uid] = PointLoadMass()
-        for line_element in (self.parent_model
-                             .list_of_beamcolumn_elements()):
-            self.line_element_udl[line_element.uid] = \
-                LineElementUDL(self, line_element)
-        # initialize tributary area analysis for each level
+        # initialize loads and mass for each node and element, and
+        # tributary area analysis for each level, in a single pass
+        # over the levels of the model
         for lvlkey, lvl in self.parent_model.levels.items():
+            nodes = list(lvl.nodes.values())
+            line_elements: list[
+                ElasticBeamColumn | DispBeamColumn] = []
+            for component in lvl.components.values():
+                nodes.extend(component.internal_nodes.values())
+                line_elements.extend(
+                    component.elastic_beamcolumn_elements.values())
+                line_elements.extend(
+                    component.disp_beamcolumn_elements.values())
+            # the load and mass vectors of the nodes of each level
+            # and the udl vectors of its elements are rows of
+            # contiguous arrays
+            loads = np.zeros((len(nodes), 6))
+            masses = np.zeros((len(nodes), 6))
+            udls = np.zeros((len(line_elements), 3))
+            self.node_loads.update(
+                {node.uid: PointLoadMass(row)
+                 for node, row in zip(nodes, loads)})
+            self.node_mass.update(
+                {node.uid: PointLoadMass(row)
+                 for node, row in zip(nodes, masses)})
+            self.line_element_udl.update(
+                {elm.uid: LineElementUDL(self, elm, row)
+                 for elm, row in zip(line_elements, udls)})
             self.tributary_area_analysis[lvlkey] = \
                 TributaryAreaAnaysis(self, lvl)
 
@@ -16,16 +16,24 @@ from __future__ import annotations
 from typing import Optional
 from typing import Any
 from itertools import count
-from descartes.patch import PolygonPatch  # type: ignore
+import math
 import numpy as np
 import numpy.typing as npt
-import matplotlib.pyplot as plt   # type: ignore
 from shapely.geometry import Polygon as shapely_Polygon   # type: ignore
+from shapely.prepared import prep   # type: ignore
+from shapely.ops import unary_union   # type: ignore
 from .import common
 
 nparr = npt.NDArray[np.float64]
 
 
+def isclose(val_a: float, val_b: float) -> bool:
+    """
+    Scalar equivalent of `np.isclose` with its default tolerances.
+    """
+    return abs(val_a - val_b) <= 1.00e-8 + 1.00e-5 * abs(val_b)
+
+
 class Vertex:
     """
     2D Vertex.
@@ -42,8 +50,13 @@ class Vertex:
         self.uid: int = next(self._ids)
 
     def __eq__(self, other):
+        if not isinstance(other, Vertex):
+            return NotImplemented
         return self.uid == other.uid
 
+    def __hash__(self):
+        return hash(self.uid)
+
     def __repr__(self):
         return f'(V{self.uid} @ {self.coords}) '
 
@@ -64,9 +77,10 @@ class Edge:
         self.uid = next(self._ids)
         self.h_i: Optional[Halfedge] = None
         self.h_j: Optional[Halfedge] = None
-        if self not in self.v_i.edges:
-            self.v_i.edges.append(self)
-        if self not in self.v_j.edges:
+        # a newly created edge can't already be connected to its
+        # vertices, unless both of its ends are the same vertex
+        self.v_i.edges.append(self)
+        if self.v_j != self.v_i:
             self.v_j.edges.append(self)
 
     def __repr__(self):
@@ -117,25 +131,32 @@ class Edge:
         not both (returns True).
         """
 
+        # the edges are described by scalars rather than small
+        # arrays: this method is called for every candidate pair
+        # produced by `find_overlapping_edges`, and the overhead of
+        # array creation and np.linalg calls would dominate.
         # location of this edge
-        vec_ra: nparr = np.array(self.v_i.coords)
+        r_ax, r_ay = self.v_i.coords
         # direction of this edge
-        vec_da: nparr = (np.array(self.v_j.coords)
-                         - np.array(self.v_i.coords))
+        d_ax = self.v_j.coords[0] - r_ax
+        d_ay = self.v_j.coords[1] - r_ay
         # location of other edge
-        vec_rb: nparr = np.array(other.v_i.coords)
+        r_bx, r_by = other.v_i.coords
         # direction of other edge
-        vec_db: nparr = (np.array(other.v_j.coords)
-                         - np.array(other.v_i.coords))
+        d_bx = other.v_j.coords[0] - r_bx
+        d_by = other.v_j.coords[1] - r_by
+        d_a2 = d_ax * d_ax + d_ay * d_ay
         # verify that the edges have nonzero length
-        assert not np.isclose(vec_da @ vec_da, 0.00)
-        assert not np.isclose(vec_db @ vec_db, 0.00)
+        assert not isclose(d_a2, 0.00)
+        assert not isclose(d_bx * d_bx + d_by * d_by, 0.00)
 
-        mat_a: nparr = np.column_stack((vec_da, -vec_db))
-        mat_b = vec_rb - vec_ra
-        determinant = np.linalg.det(mat_a)
+        # rb - ra
+        r_x = r_bx - r_ax
+        r_y = r_by - r_ay
+        # determinant of [[d_ax, -d_bx], [d_ay, -d_by]]
+        determinant = -d_ax * d_by + d_bx * d_ay
 
-        if np.isclose(determinant, 0.00):
+        if isclose(determinant, 0.00):
 
             # there are infinite solutions
             # or there are no solutions
@@ -147,13 +168,10 @@ class Edge:
 
             # first check if they are parallel but not colinear
             # project start of other vertex onto line of this vertex
-            vec_rb_diff = (vec_rb - vec_ra)
-            vec_proj_pt = ((vec_rb_diff @ vec_da)/(vec_da @ vec_da)
-                           * vec_da + vec_ra)
-            vec_dist = vec_rb - vec_proj_pt
-            distance = np.sqrt(vec_dist @ vec_dist)
+            c_i = (d_ax * r_x + d_ay * r_y) / d_a2
+            distance = math.hypot(r_x - c_i * d_ax, r_y - c_i * d_ay)
 
-            if not np.isclose(distance, 0.00):
+            if not isclose(distance, 0.00):
                 # The edges are parallel but not collinear, so they
                 # can't be intersecting.
                 return False
@@ -176,8 +194,8 @@ class Edge:
             # j of other edge.
             # We can then determine which of the three cases we are
             # in, based on the values of c_i and c_j.
-            c_i = (vec_da @ (vec_rb - vec_ra)) / (vec_da @ vec_da)
-            c_j = (vec_da @ ((vec_rb+vec_db) - vec_ra)) / (vec_da @ vec_da)
+            # (c_i was computed above)
+            c_j = (d_ax * (r_x + d_bx) + d_ay * (r_y + d_by)) / d_a2
             # either they should be both < 0 (which means that the
             # other edge is "before" this edge), or they should be
             # both > 1.00 (which means that the other edge is "after"
@@ -189,13 +207,13 @@ class Edge:
             # when making comparisons.
             epsilon = common.EPSILON
             if (
-                    (c_i < 0.00 - epsilon and np.isclose(c_j, 0.00))
+                    (c_i < 0.00 - epsilon and isclose(c_j, 0.00))
                     or
-                    (c_i > 1.00 + epsilon and np.isclose(c_j, 1.00))
+                    (c_i > 1.00 + epsilon and isclose(c_j, 1.00))
                     or
-                    (np.isclose(c_i, 1.00) and c_j > 1.00 + epsilon)
+                    (isclose(c_i, 1.00) and c_j > 1.00 + epsilon)
                     or
-                    (np.isclose(c_i, 0.00) and c_j < 0.00 - epsilon)
+                    (isclose(c_i, 0.00) and c_j < 0.00 - epsilon)
             ):
                 # they share one vertex without overlap
                 return False
@@ -207,13 +225,14 @@ class Edge:
             return True
 
         # Otherwise they are not parallel.
-        # there is at least one solution
-        sol = np.linalg.solve(mat_a, mat_b)
+        # there is exactly one solution, obtained with Cramer's rule
+        sol_a = (-r_x * d_by + d_bx * r_y) / determinant
+        sol_b = (d_ax * r_y - d_ay * r_x) / determinant
         # if both constants are between 0 and 1
         # the edges overlap within their length
         # otherwise, their extensions overlap, which
         # is not an issue.
-        if 0.00 < sol[0] < 1.00 and 0.00 < sol[1] < 1.00:
+        if 0.00 < sol_a < 1.00 and 0.00 < sol_b < 1.00:
             return True
 
         return False
@@ -256,11 +275,11 @@ class Halfedge:
         Calculates the angular direction of the halfedge
         using the arctan2 function
         """
-        drct: nparr = (np.array(self.edge.other_vertex(self.vertex).coords) -
-                       np.array(self.vertex.coords))
-        norm = np.linalg.norm(drct)
-        drct /= norm
-        return np.arctan2(drct[1], drct[0])
+        edge = self.edge
+        v_to = edge.v_j if self.vertex is edge.v_i else edge.v_i
+        x_to, y_to = v_to.coords
+        x_from, y_from = self.vertex.coords
+        return math.atan2(y_to - y_from, x_to - x_from)
 
 
 class Mesh:
@@ -272,29 +291,138 @@ class Mesh:
 
     def __init__(self, halfedges: list[Halfedge]):
         self.halfedges = halfedges
+        self.vertex_coords: Optional[nparr] = None
+        self.bbox: Optional[nparr] = None
+        self.geom_props: Optional[dict[str, Any]] = None
 
     def __repr__(self):
         num = len(self.halfedges)
         return f'Mesh object containing {num} halfedges.'
 
+    def coords_array(self) -> nparr:
+        """
+        Returns an (N, 2) array with the coordinates of the starting
+        vertex of each halfedge of the mesh.
+        Meshes are not modified after they are defined, so it is only
+        computed once.
+        """
+        if self.vertex_coords is None:
+            self.vertex_coords = np.array(
+                [h.vertex.coords for h in self.halfedges], dtype=float)
+        return self.vertex_coords
+
     def geometric_properties(self):
         """
         Calculates the geometric properties of the shape defined by
         the mesh
+        Meshes are not modified after they are defined, so they are
+        only computed once.
         """
-        coords: nparr = np.array([h.vertex.coords for h in self.halfedges])
-        return geometric_properties(coords)
+        if self.geom_props is None:
+            self.geom_props = geometric_properties(self.coords_array())
+        return self.geom_props
 
     def bounding_box(self):
         """
-        Returns a bounding box of the mesh
+        Returns a bounding box of the mesh.
+        Meshes are not modified after they are defined, so it is only
+        computed once.
         """
-        coords: nparr = np.array([h.vertex.coords for h in self.halfedges])
-        xmin = min(coords[:, 0])
-        xmax = max(coords[:, 0])
-        ymin = min(coords[:, 1])
-        ymax = max(coords[:, 1])
-        return np.array([[xmin, ymin], [xmax, ymax]])
+        if self.bbox is None:
+            coords = self.coords_array()
+            self.bbox = np.array(
+                [np.min(coords, axis=0), np.max(coords, axis=0)])
+        return self.bbox
+
+
+#######################
+# Edge overlap checks #
+#######################
+
+
+def find_overlapping_edges(
+        edges: list[Edge]) -> Optional[tuple[Edge, Edge]]:
+    """
+    Checks all pairs of edges for overlaps or crossings and returns
+    the first offending pair, or None.
+    Only pairs of edges with overlapping bounding boxes can overlap
+    or cross. Those are identified by sweeping the edges in order of
+    increasing minimum x coordinate. Edges are also grouped by
+    direction. Pairs within the same group are parallel and can only
+    overlap if they are colinear, so they skip the determinant and
+    only those that are colinear are delegated to
+    `Edge.overlaps_or_crosses`. The 2x2 systems of the remaining
+    pairs involving a given edge are solved at once with Cramer's
+    rule.
+    Args:
+        edges (list[Edge]): List of Edge objects
+    Returns:
+        The first pair of overlapping or crossing edges, if any.
+    """
+    num_edges = len(edges)
+    if num_edges < 2:
+        return None
+    # location and direction of all edges
+    vec_r: nparr = np.array([edge.v_i.coords for edge in edges])
+    vec_d: nparr = np.array([edge.v_j.coords for edge in edges]) - vec_r
+    lengths = np.sqrt(np.sum(vec_d**2, axis=1))
+    # verify that the edges have nonzero length
+    assert not np.any(np.isclose(lengths**2, 0.00))
+    # direction groups (unit vectors with a consistent sign)
+    unit_d = vec_d / lengths[:, np.newaxis]
+    flip = ((unit_d[:, 0] < -common.EPSILON)
+            | ((np.abs(unit_d[:, 0]) <= common.EPSILON)
+               & (unit_d[:, 1] < 0.00)))
+    unit_d[flip, :] *= -1.00
+    _, group = np.unique(
+        np.round(unit_d, 9), axis=0, return_inverse=True)
+    group = group.reshape(-1)
+    # bounding boxes
+    bb_min = np.minimum(vec_r, vec_r + vec_d) - common.EPSILON
+    bb_max = np.maximum(vec_r, vec_r + vec_d) + common.EPSILON
+    order = np.argsort(bb_min[:, 0], kind='stable')
+    # the edges after edge order[k] that overlap with it in the x
+    # direction are order[k+1:stops[k]]
+    stops = np.searchsorted(bb_min[order, 0], bb_max[order, 0], side='right')
+    for k in range(num_edges - 1):
+        i = order[k]
+        others = order[k+1:stops[k]]
+        others = others[(bb_min[others, 1] <= bb_max[i, 1])
+                        & (bb_max[others, 1] >= bb_min[i, 1])]
+        if not others.size:
+            continue
+        vec_ra = vec_r[i, :]
+        vec_da = vec_d[i, :]
+        vec_b = vec_r[others, :] - vec_ra
+        parallel = group[others] == group[i]
+        crossing = np.full(len(others), False)
+        # parallel pairs: distance of the other edge from this line
+        offset = (vec_da[0] * vec_b[parallel, 1]
+                  - vec_da[1] * vec_b[parallel, 0]) / lengths[i]
+        parallel[parallel] = np.isclose(offset, 0.00)
+        # remaining pairs
+        rest = np.flatnonzero(group[others] != group[i])
+        if rest.size:
+            vec_db = vec_d[others[rest], :]
+            vec_bb = vec_b[rest, :]
+            determinant = (-vec_da[0] * vec_db[:, 1]
+                           + vec_db[:, 0] * vec_da[1])
+            near_parallel = np.isclose(determinant, 0.00)
+            determinant[near_parallel] = 1.00
+            sol_a = (-vec_bb[:, 0] * vec_db[:, 1]
+                     + vec_db[:, 0] * vec_bb[:, 1]) / determinant
+            sol_b = (vec_da[0] * vec_bb[:, 1]
+                     - vec_da[1] * vec_bb[:, 0]) / determinant
+            crossing[rest] = ((~near_parallel)
+                              & (sol_a > 0.00) & (sol_a < 1.00)
+                              & (sol_b > 0.00) & (sol_b < 1.00))
+            parallel[rest] = near_parallel
+        for idx in np.flatnonzero(crossing | parallel):
+            j = others[idx]
+            edge_a, edge_b = edges[min(i, j)], edges[max(i, j)]
+            if crossing[idx] or edge_a.overlaps_or_crosses(edge_b):
+                return edge_a, edge_b
+    return None
 
 
 ############################################
@@ -302,6 +430,43 @@ class Mesh:
 ############################################
 
 
+def polygon_sides(
+        coords: nparr) -> tuple[nparr, nparr, nparr, nparr, nparr]:
+    """
+    Returns the coordinates of the start and end point of each side
+    of a polygon, along with the cross product term of each side
+    that all the geometric properties below are based on.
+    The coordinates are slice views of a single closed copy of
+    `coords`, so that no shifted copies are needed.
+    Args:
+        coords: A matrix whose columns represent
+                the coordinates and the rows
+                represent the points of the polygon.
+                The first point should not be repeated
+                at the end, as this is done
+                automatically.
+    Returns:
+        x_1, y_1, x_2, y_2 (nparr): start and end point coordinates
+        alpha (nparr): x_1 * y_2 - x_2 * y_1
+    """
+    return closed_polygon_sides(np.concatenate((coords, coords[:1])))
+
+
+def closed_polygon_sides(
+        closed: nparr) -> tuple[nparr, nparr, nparr, nparr, nparr]:
+    """
+    Same as `polygon_sides`, for a coordinate matrix in which the
+    first point is already repeated at the end. The returned
+    coordinates are views of `closed`.
+    """
+    x_1 = closed[:-1, 0]
+    y_1 = closed[:-1, 1]
+    x_2 = closed[1:, 0]
+    y_2 = closed[1:, 1]
+    alpha = x_1 * y_2 - x_2 * y_1
+    return x_1, y_1, x_2, y_2, alpha
+
+
 def polygon_area(coords: nparr) -> float:
     """
     Calculates the area of a polygon.
@@ -315,10 +480,51 @@ def polygon_area(coords: nparr) -> float:
     Returns:
         area (float): The area of the polygon.
     """
-    x_coords = coords[:, 0]
-    y_coords = coords[:, 1]
-    return float(np.sum(x_coords * np.roll(y_coords, -1) -
-                        np.roll(x_coords, -1) * y_coords) / 2.00)
+    *_, alpha = polygon_sides(coords)
+    return float(np.sum(alpha)) / 2.00
+
+
+def polygon_areas(coords_list: list[nparr]) -> nparr:
+    """
+    Calculates the areas of multiple polygons at once.
+    Args:
+        coords_list: A list of coordinate matrices,
+                     one for each polygon, as in
+                     `polygon_area`.
+    Returns:
+        areas (nparr): The area of each polygon.
+    """
+    if not coords_list:
+        return np.zeros(0)
+    return polygon_areas_flat(
+        np.concatenate(coords_list),
+        np.array([len(coords) for coords in coords_list], dtype=np.intp))
+
+
+def polygon_areas_flat(
+        all_coords: nparr, counts: npt.NDArray[np.intp]) -> nparr:
+    """
+    Calculates the areas of multiple polygons at once, given the
+    coordinates of all their points stacked in a single matrix.
+    Args:
+        all_coords: A matrix containing the coordinates of the
+                    points of all polygons, one polygon after the
+                    other, as in `polygon_area`.
+        counts: The number of points of each polygon.
+    Returns:
+        areas (nparr): The area of each polygon.
+    """
+    if not len(counts):
+        return np.zeros(0)
+    starts: npt.NDArray[np.intp] = np.cumsum(counts) - counts
+    # index of the next point of each point, wrapping around to the
+    # first point within each polygon
+    nxt = np.arange(1, len(all_coords) + 1)
+    nxt[starts + counts - 1] = starts
+    x_coords = all_coords[:, 0]
+    y_coords = all_coords[:, 1]
+    cross = x_coords * y_coords[nxt] - x_coords[nxt] * y_coords
+    return np.add.reduceat(cross, starts) / 2.00
 
 
 def polygon_centroid(coords: nparr) -> nparr:
@@ -335,15 +541,18 @@ def polygon_centroid(coords: nparr) -> nparr:
         centroid (nparr): The centroid of
                  the polygon.
     """
-    x_coords = coords[:, 0]
-    y_coords = coords[:, 1]
-    area = polygon_area(coords)
-    x_cent = (np.sum((x_coords + np.roll(x_coords, -1)) *
-                     (x_coords*np.roll(y_coords, -1) -
-                      np.roll(x_coords, -1)*y_coords)))/(6.0*area)
-    y_cent = (np.sum((y_coords + np.roll(y_coords, -1)) *
-                     (x_coords*np.roll(y_coords, -1) -
-                      np.roll(x_coords, -1)*y_coords)))/(6.0*area)
+    x_1, y_1, x_2, y_2, alpha = polygon_sides(coords)
+    area = float(np.sum(alpha)) / 2.00
+    return centroid_from_sides(x_1, y_1, x_2, y_2, alpha, area)
+
+
+def centroid_from_sides(x_1, y_1, x_2, y_2, alpha, area) -> nparr:
+    """
+    Calculates the centroid of a polygon from the output of
+    `polygon_sides` and its area.
+    """
+    x_cent = np.sum((x_1 + x_2) * alpha) / (6.0*area)
+    y_cent = np.sum((y_1 + y_2) * alpha) / (6.0*area)
     return np.array((x_cent, y_cent))
 
 
@@ -369,22 +578,28 @@ def polygon_inertia(coords):
         # TODO
         # The terms might not be pedantically accurate
     """
-    x_coords = coords[:, 0]
-    y_coords = coords[:, 1]
-    area = polygon_area(coords)
-    alpha = x_coords * np.roll(y_coords, -1) - \
-        np.roll(x_coords, -1) * y_coords
+    x_1, y_1, x_2, y_2, alpha = polygon_sides(coords)
+    area = float(np.sum(alpha)) / 2.00
+    return inertia_from_sides(x_1, y_1, x_2, y_2, alpha, area)
+
+
+def inertia_from_sides(x_1, y_1, x_2, y_2, alpha, area):
+    """
+    Calculates the moments of inertia of a polygon from the output
+    of `polygon_sides` and its area.
+    See `polygon_inertia`.
+    """
     # planar moment of inertia wrt horizontal axis
-    ixx = np.sum((y_coords**2 + y_coords * np.roll(y_coords, -1) +
-                  np.roll(y_coords, -1)**2)*alpha)/12.00
+    ixx = float(np.sum((y_1**2 + y_1 * y_2 +
+                        y_2**2)*alpha))/12.00
     # planar moment of inertia wrt vertical axis
-    iyy = np.sum((x_coords**2 + x_coords * np.roll(x_coords, -1) +
-                  np.roll(x_coords, -1)**2)*alpha)/12.00
+    iyy = float(np.sum((x_1**2 + x_1 * x_2 +
+                        x_2**2)*alpha))/12.00
 
-    ixy = np.sum((x_coords*np.roll(y_coords, -1)
-                  + 2.0*x_coords*y_coords
-                  + 2.0*np.roll(x_coords, -1) * np.roll(y_coords, -1)
-                  + np.roll(x_coords, -1) * y_coords)*alpha)/24.
+    ixy = float(np.sum((x_1*y_2
+                        + 2.0*x_1*y_1
+                        + 2.0*x_2 * y_2
+                        + x_2 * y_1)*alpha))/24.
     # polar (torsional) moment of inertia
     i_r = ixx + iyy
     # mass moment of inertia wrt in-plane rotation
@@ -399,12 +614,15 @@ def geometric_properties(coords):
     Aggregates the results of the previous functions.
     """
 
-    # repeat the first row at the end to close the shape
-    coords = np.vstack((coords, coords[0, :]))
-    area = polygon_area(coords)
-    centroid = polygon_centroid(coords)
-    coords_centered = coords - centroid
-    inertia = polygon_inertia(coords_centered)
+    # the sides are views of a single closed copy of the
+    # coordinates, which is centered in place for the inertia
+    closed = np.concatenate((coords, coords[:1]))
+    x_1, y_1, x_2, y_2, alpha = closed_polygon_sides(closed)
+    area = float(np.sum(alpha)) / 2.00
+    centroid = centroid_from_sides(x_1, y_1, x_2, y_2, alpha, area)
+    closed -= centroid
+    inertia = inertia_from_sides(
+        x_1, y_1, x_2, y_2, x_1 * y_2 - x_2 * y_1, area)
 
     return {'area': area, 'centroid': centroid, 'inertia': inertia}
 
@@ -419,11 +637,9 @@ def ang_reduce(ang):
     """
     Brings and angle expressed in radians in the interval [0, 2pi)
     """
-    while ang < 0:
-        ang += 2.*np.pi
-    while ang >= 2.*np.pi:
-        ang -= 2.*np.pi
-    return ang
+    res = ang % (2.*np.pi)
+    # tiny negative angles would otherwise round up to 2pi
+    return res if res < 2.*np.pi else 0.00
 
 
 def define_halfedges(edges: list[Edge]) -> list[Halfedge]:
@@ -459,24 +675,38 @@ def define_halfedges(edges: list[Edge]) -> list[Halfedge]:
     # none of them knows its `next`.
     # We now assign that attribute to all halfedges
 
+    # the directions of all halfedges are computed at once (see
+    # `Halfedge.direction`). The two halfedges of each edge are
+    # stored next to each other and point in opposite directions.
+    if not edges:
+        return all_halfedges
+    vec_d: nparr = (np.array([edge.v_j.coords for edge in edges])
+                    - np.array([edge.v_i.coords for edge in edges]))
+    vec_d = np.repeat(vec_d, 2, axis=0)
+    vec_d[1::2, :] *= -1.00
+    directions = dict(zip(
+        (halfedge.uid for halfedge in all_halfedges),
+        np.arctan2(vec_d[:, 1], vec_d[:, 0]).tolist()))
+
+    # the halfedges leaving each vertex are sorted by direction,
+    # once. Going around a vertex clockwise, the halfedge that
+    # precedes the conjugate of `h` forms the smallest angle with
+    # it, so it is `h`'s `next`. When the conjugate is the only
+    # halfedge leaving that vertex, it becomes the `next`.
+    position: dict[int, int] = {}
+    for vertex in dict.fromkeys(h.vertex for h in all_halfedges):
+        vertex.halfedges.sort(key=lambda h: directions[h.uid])
+        for i, h_other in enumerate(vertex.halfedges):
+            position[h_other.uid] = i
+
     for halfedge in all_halfedges:
         # We are looking for `h`'s `next`
-        # determine the vertex that it starts from
-        v_from = halfedge.vertex
-        # determine the vertex that it points to
-        v_to = halfedge.edge.other_vertex(v_from)
-        # get a list of all halfedges leaving that vertex
-        candidates_for_next = v_to.halfedges
-        # determine which of all these halfedges will be the next
-        angles = np.full(len(candidates_for_next), 0.00)
-        for i, h_other in enumerate(candidates_for_next):
-            if h_other.edge == halfedge.edge:
-                angles[i] = 1000.
-                # otherwise we would assign its conjugate as next
-            else:
-                angles[i] = ang_reduce(
-                    (halfedge.direction() - np.pi) - h_other.direction())
-        halfedge.nxt = candidates_for_next[np.argmin(angles)]
+        edge = halfedge.edge
+        conjugate = edge.h_j if halfedge is edge.h_i else edge.h_i
+        assert conjugate is not None
+        # the conjugate leaves from the vertex `h` points to
+        candidates_for_next = conjugate.vertex.halfedges
+        halfedge.nxt = candidates_for_next[position[conjugate.uid] - 1]
 
     return all_halfedges
 
@@ -522,20 +752,18 @@ def obtain_closed_loops(halfedges):
         loops (list[list[Halfedge]]) with the
               aforementioned property.
     """
-    def is_in_some_loop(halfedge, loops):
-        for loop in loops:
-            if halfedge in loop:
-                return True
-        return False
     loops: list[list[Halfedge]] = []
+    # uids of the halfedges that are already part of some loop
+    visited: set[int] = set()
     for halfedge in halfedges:
-        if loops:
-            if is_in_some_loop(halfedge, loops):
-                continue
+        if halfedge.uid in visited:
+            continue
         loop = [halfedge]
+        visited.add(halfedge.uid)
         nxt = halfedge.nxt
         while nxt != halfedge:
             loop.append(nxt)
+            visited.add(nxt.uid)
             nxt = nxt.nxt
         loops.append(loop)
     return loops
@@ -554,19 +782,21 @@ def orient_loops(loops):
         internal_loops (list[list[Halfedge]])
         trivial_loops (list[list[Halfedge]])
     """
-    internal_loops = []
-    external_loops = []
-    trivial_loops = []
-    loop_areas = [polygon_area(
-        np.array([h.vertex.coords for h in loop]))
-        for loop in loops]
-    for i, area in enumerate(loop_areas):
-        if area > common.EPSILON:
-            internal_loops.append(loops[i])
-        elif area < -common.EPSILON:
-            external_loops.append(loops[i])
-        else:
-            trivial_loops.append(loops[i])
+    # the coordinates of all loops are gathered in a single matrix
+    # and their areas are computed at once
+    all_coords: nparr = np.array(
+        [h.vertex.coords for loop in loops for h in loop],
+        dtype=float).reshape(-1, 2)
+    loop_areas = polygon_areas_flat(
+        all_coords,
+        np.array([len(loop) for loop in loops], dtype=np.intp))
+    internal_loops = [
+        loops[i] for i in np.flatnonzero(loop_areas > common.EPSILON)]
+    external_loops = [
+        loops[i] for i in np.flatnonzero(loop_areas < -common.EPSILON)]
+    trivial_loops = [
+        loops[i] for i in np.flatnonzero(
+            np.abs(loop_areas) <= common.EPSILON)]
     return external_loops, internal_loops, trivial_loops
 
 
@@ -575,6 +805,42 @@ def orient_loops(loops):
 #######################################
 
 
+def grid_tiles(x_array: nparr, y_array: nparr) -> nparr:
+    """
+    Returns the corner coordinates of the rectangular tiles of the
+    grid defined by the given x and y coordinates, as an (N, 4, 2)
+    array. The tiles are ordered by x and then by y.
+    """
+    grid = np.stack(np.meshgrid(x_array, y_array, indexing='ij'), axis=-1)
+    tiles: nparr = np.stack(
+        (grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:]),
+        axis=2).reshape(-1, 4, 2)
+    return tiles
+
+
+def intersect_tiles(polygon, tiles: nparr) -> list[shapely_Polygon]:
+    """
+    Returns the nonempty intersections of a shapely polygon with
+    each one of the given tiles (see `grid_tiles`).
+    The polygon is tested against every tile, so it is prepared
+    once. Only the tiles crossing its boundary need to be
+    intersected with it.
+    """
+    prepared_polygon = prep(polygon)
+    pieces = []
+    for tile_coords in tiles:
+        tile = shapely_Polygon(tile_coords)
+        if not prepared_polygon.intersects(tile):
+            continue
+        if prepared_polygon.contains(tile):
+            subregion = tile
+        else:
+            subregion = polygon.intersection(tile)
+        if subregion.area != 0.0:
+            pieces.append(subregion)
+    return pieces
+
+
 def subdivide_polygon(outside, holes, n_x, n_y, plot=False):
     """
     Used to define the fibers of fiber sections.
@@ -588,29 +854,24 @@ def subdivide_polygon(outside, holes, n_x, n_y, plot=False):
         pieces (list[shapely_Polygon]): shapely_Polygon
                objects that represent single fibers.
     """
-    outside_polygon = shapely_Polygon(
-        [h.vertex.coords for h in outside.halfedges])
+    outside_polygon = shapely_Polygon(outside.coords_array())
     hole_polygons = []
     for hole in holes.values():
-        hole_polygons.append(shapely_Polygon(
-            [h.vertex.coords for h in hole.halfedges]))
+        hole_polygons.append(shapely_Polygon(hole.coords_array()))
     remaining_polygon = outside_polygon
-    for hole_polygon in hole_polygons:
-        remaining_polygon = remaining_polygon.difference(hole_polygon)
+    if hole_polygons:
+        # subtract all holes in a single overlay operation
+        remaining_polygon = outside_polygon.difference(
+            unary_union(hole_polygons))
     x_min, y_min, x_max, y_max = outside_polygon.bounds
     x_array = np.linspace(x_min, x_max, num=n_x, endpoint=True)
     y_array = np.linspace(y_min, y_max, num=n_y, endpoint=True)
-    pieces = []
-    for i in range(len(x_array)-1):
-        for j in range(len(y_array)-1):
-            tile = shapely_Polygon([(x_array[i], y_array[j]),
-                                    (x_array[i+1], y_array[j]),
-                                    (x_array[i+1], y_array[j+1]),
-                                    (x_array[i], y_array[j+1])])
-            subregion = remaining_polygon.intersection(tile)
-            if subregion.area != 0.0:
-                pieces.append(subregion)
+    pieces = intersect_tiles(
+        remaining_polygon, grid_tiles(x_array, y_array))
     if plot:
+        # plotting libraries are only needed for debugging
+        import matplotlib.pyplot as plt   # type: ignore
+        from descartes.patch import PolygonPatch  # type: ignore
         fig = plt.figure()
         ax_1 = fig.add_subplot(111)
         ax_1.set_aspect('equal')
@@ -655,7 +916,7 @@ def subdivide_hss(sec_h: float, sec_b: float, sec_t: float,
     remaining_polygon = outside_polygon.difference(hole_polygon)
     x_min, y_min, x_max, y_max = outside_polygon.bounds
     # cutting it into 8 regions
-    pieces = []
+    tiles = []
     for ylow, yhigh in zip(
             (y_min, y_min+sec_t, y_max-sec_t),
             (y_min+sec_t, y_max-sec_t, y_max)
@@ -668,18 +929,13 @@ def subdivide_hss(sec_h: float, sec_b: float, sec_t: float,
                 xlow, xhigh, num=5, endpoint=True)
             y_array = np.linspace(
                 ylow, yhigh, num=5, endpoint=True)
-            for i in range(len(x_array)-1):
-                for j in range(len(y_array)-1):
-                    tile = shapely_Polygon(
-                        [(x_array[i], y_array[j]),
-                         (x_array[i+1], y_array[j]),
-                         (x_array[i+1], y_array[j+1]),
-                         (x_array[i], y_array[j+1])])
-                    subregion = remaining_polygon.intersection(tile)
-                    if subregion.area != 0.0:
-                        pieces.append(subregion)
+            tiles.append(grid_tiles(x_array, y_array))
+    pieces = intersect_tiles(remaining_polygon, np.concatenate(tiles))
 
     if plot:
+        # plotting libraries are only needed for debugging
+        import matplotlib.pyplot as plt   # type: ignore
+        from descartes.patch import PolygonPatch  # type: ignore
         fig = plt.figure()
         ax_1 = fig.add_subplot(111)
         ax_1.set_aspect('equal')
@@ -732,6 +988,7 @@ def plot_loop(halfedge_loop):
     for i, halfedge in enumerate(halfedge_loop):
         coords[i, :] = halfedge.vertex.coords
     coords[-1, :] = coords[0, :]
+    import matplotlib.pyplot as plt   # type: ignore
     fig = plt.figure()
     plt.plot(coords[:, 0], coords[:, 1])
     plt.scatter(coords[:, 0], coords[:, 1])
@@ -742,6 +999,7 @@ def plot_edges(edges):
     """
     Plots the given edges.
     """
+    import matplotlib.pyplot as plt   # type: ignore
     fig = plt.figure()
     for edge in edges:
         coords = np.full((2, 2), 0.00)
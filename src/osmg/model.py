@@ -15,14 +15,19 @@ Model Generator for OpenSees ~ model
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Optional
 from dataclasses import dataclass, field
 import numpy as np
 import numpy.typing as npt
 from shapely.geometry import Polygon as shapely_Polygon   # type: ignore
 from shapely.geometry import Point   # type: ignore
+from shapely.prepared import prep   # type: ignore
 
 from .gen.uid_gen import UIDGenerator
 from . import collections
+from . import common
 from .level import Level
 
 if TYPE_CHECKING:
@@ -51,13 +56,25 @@ def transfer_component(
     # note: we don't copy the component assemblies and their contents.
     # we just add the same objects to the other model.
     level = component.parent_collection.parent
-    other_level = other.levels.retrieve_by_attr('uid', level.uid)
+    other_level = other.levels[level.uid]
     for node in component.external_nodes.values():
         if node.uid not in other_level.nodes:
             other_level.nodes.add(node)
     other_level.components.add(component)
 
 
+def merge_collections(dcts: list[dict[Any, Any]]) -> dict[Any, Any]:
+    """
+    Merges the given dictionaries (or collections) into a new
+    dictionary. `dict.update` copies the entries of each one in a
+    single C-level loop.
+    """
+    res: dict[Any, Any] = {}
+    for dct in dcts:
+        res.update(dct)
+    return res
+
+
 @dataclass
 class Settings:
     """
@@ -109,6 +126,12 @@ class Model:
     uid_generator: UIDGenerator = field(
         default_factory=UIDGenerator)
     settings: Settings = field(default_factory=Settings)
+    list_cache: dict[str, tuple[int, tuple[Any, ...]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    dict_cache: dict[str, tuple[int, dict[Any, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    coords_cache: Optional[tuple[int, nparr]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self.levels = collections.CollectionActive(self)
@@ -140,15 +163,52 @@ class Model:
         the associated components as values.
         """
         res = {}
-        components = self.list_of_components()
-        for component in components:
-            uids = [node.uid for node in component.external_nodes.values()]
-            uids.sort()
-            uids_tuple = (*uids,)
+        for component in self.iter_components():
+            uids_tuple = common.connectivity_key(
+                list(component.external_nodes.values()))
             assert uids_tuple not in res, 'Error! Duplicate component found.'
             res[uids_tuple] = component
         return res
 
+    def cached_tuple(self, key: str,
+                     builder: Callable[[], list[Any]]) -> tuple[Any, ...]:
+        """
+        Returns a sequence of objects derived from the contents of
+        the model's collections, as an immutable tuple that can be
+        shared without copying. The sequence is only rebuilt after
+        the contents of some collection change.
+        """
+        version = collections.Collection.version
+        cached = self.list_cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, tuple(builder()))
+            self.list_cache[key] = cached
+        return cached[1]
+
+    def cached_list(self, key: str,
+                    builder: Callable[[], list[Any]]) -> list[Any]:
+        """
+        Returns a list derived from the contents of the model's
+        collections (see `cached_tuple`). Callers are free to modify
+        the returned list.
+        """
+        return list(self.cached_tuple(key, builder))
+
+    def cached_dict(self, key: str,
+                    builder: Callable[[], dict[Any, Any]]
+                    ) -> dict[Any, Any]:
+        """
+        Returns a copy of a dictionary derived from the contents of
+        the model's collections. The dictionary is only rebuilt
+        after the contents of some collection change.
+        """
+        version = collections.Collection.version
+        cached = self.dict_cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, builder())
+            self.dict_cache[key] = cached
+        return dict(cached[1])
+
     def add_level(self,
                   uid: int,
                   elevation: float):
@@ -158,185 +218,241 @@ class Model:
         lvl = Level(self, uid=uid, elevation=elevation)
         self.levels.add(lvl)
 
-    def dict_of_primary_nodes(self):
+    def dict_of_primary_nodes(self) -> dict[int, Node]:
         """
         Returns a dictionary of all the primary nodes in the model.
         The keys are the uids of the nodes.
         """
-        dict_of_nodes: dict[int, Node] = {}
-        for lvl in self.levels.values():
-            dict_of_nodes.update(lvl.nodes)
-        return dict_of_nodes
+        return self.cached_dict(
+            'primary_nodes',
+            lambda: merge_collections(
+                [lvl.nodes for lvl in self.levels.values()]))
 
     def list_of_primary_nodes(self):
         """
         Returns a list of all the primary nodes in the model.
         """
-        list_of_nodes = []
-        for lvl in self.levels.values():
-            for node in lvl.nodes.values():
-                list_of_nodes.append(node)
-        return list_of_nodes
+        return self.cached_list(
+            'primary_nodes',
+            lambda: [node for lvl in self.levels.values()
+                     for node in lvl.nodes.values()])
 
-    def dict_of_internal_nodes(self):
+    def dict_of_internal_nodes(self) -> dict[int, Node]:
         """
         Returns a dictionary of all the internal nodes in the model.
         The keys are the uids of the nodes.
         """
-        dict_of_nodes: dict[int, Node] = {}
-        for lvl in self.levels.values():
-            for component in lvl.components.values():
-                dict_of_nodes.update(component.internal_nodes)
-        return dict_of_nodes
+        return self.cached_dict(
+            'internal_nodes',
+            lambda: merge_collections(
+                [component.internal_nodes
+                 for component in self.iter_components()]))
 
     def list_of_internal_nodes(self):
         """
         Returns a list of all the internal nodes in the model.
         """
-        list_of_nodes = []
-        for lvl in self.levels.values():
-            for component in lvl.components.values():
-                for inode in component.internal_nodes.values():
-                    list_of_nodes.append(inode)
-        return list_of_nodes
+        return self.cached_list(
+            'internal_nodes',
+            lambda: [inode for component in self.iter_components()
+                     for inode in component.internal_nodes.values()])
 
-    def dict_of_all_nodes(self):
+    def dict_of_all_nodes(self) -> dict[int, Node]:
         """
         Returns a dictionary of all the nodes in the model.
         The keys are the uids of the nodes.
         """
-        dict_of_nodes: dict[int, Node] = {}
-        dict_of_nodes.update(self.dict_of_primary_nodes())
-        dict_of_nodes.update(self.dict_of_internal_nodes())
-        return dict_of_nodes
+        def build():
+            # the first accessor already returns a fresh copy, which
+            # is extended in place
+            res = self.dict_of_primary_nodes()
+            res |= self.dict_of_internal_nodes()
+            return res
+        return self.cached_dict('all_nodes', build)
+
+    def iter_all_nodes(self) -> tuple[Node, ...]:
+        """
+        Returns all the nodes in the model, without copying the
+        cached sequence. Used when the result is only iterated over.
+        """
+        return self.cached_tuple(
+            'all_nodes',
+            lambda: (self.list_of_primary_nodes()
+                     + self.list_of_internal_nodes()))
 
     def list_of_all_nodes(self):
         """
         Returns a list of all the nodes in the model.
         """
-        list_of_nodes = []
-        list_of_nodes.extend(self.list_of_primary_nodes())
-        list_of_nodes.extend(self.list_of_internal_nodes())
-        return list_of_nodes
+        return list(self.iter_all_nodes())
 
-    def dict_of_components(self):
+    def dict_of_components(self) -> dict[int, ComponentAssembly]:
         """
         Returns a dictionary of all the component assemblies in the
         model.
         The keys are the uids of the component assemblies.
         """
-        comps: dict[int, ComponentAssembly] = {}
-        for lvl in self.levels.values():
-            for component in lvl.components.values():
-                comps[component.uid] = component
-        return comps
+        return self.cached_dict(
+            'components',
+            lambda: merge_collections(
+                [lvl.components for lvl in self.levels.values()]))
+
+    def iter_components(self) -> tuple[ComponentAssembly, ...]:
+        """
+        Returns all the component assemblies in the model, without
+        copying the cached sequence. Used when the result is only
+        iterated over.
+        """
+        return self.cached_tuple(
+            'components',
+            lambda: [component for lvl in self.levels.values()
+                     for component in lvl.components.values()])
 
     def list_of_components(self):
         """
         Returns a list of all the component assembiles in the
         model.
         """
-        return list(self.dict_of_components().values())
+        return list(self.iter_components())
 
-    def dict_of_elastic_beamcolumn_elements(self):
+    def dict_of_elastic_beamcolumn_elements(
+            self) -> dict[int, ElasticBeamColumn]:
         """
         Returns a dictionary of all ElasticBeamColumn objects in the model.
         The keys are the uids of the objects.
         """
-        elems: dict[int, ElasticBeamColumn] = {}
-        for lvl in self.levels.values():
-            for component in lvl.components.values():
-                elems.update(component.elastic_beamcolumn_elements)
-        return elems
+        return self.cached_dict(
+            'elastic_beamcolumn_elements',
+            lambda: merge_collections(
+                [component.elastic_beamcolumn_elements
+                 for component in self.iter_components()]))
 
     def list_of_elastic_beamcolumn_elements(self):
         """
         Returns a list of all ElasticBeamColumn objects in the model.
         """
-        return list(self.dict_of_elastic_beamcolumn_elements().values())
+        return self.cached_list(
+            'elastic_beamcolumn_elements',
+            lambda: [elm for component in self.iter_components()
+                     for elm in (component.elastic_beamcolumn_elements
+                                 .values())])
 
-    def dict_of_disp_beamcolumn_elements(self):
+    def dict_of_disp_beamcolumn_elements(self) -> dict[int, DispBeamColumn]:
         """
         Returns a dictionary of all DispBeamColumn objects in the model.
         The keys are the uids of the objects.
         """
-        elems: dict[int, DispBeamColumn] = {}
-        for lvl in self.levels.values():
-            for component in lvl.components.values():
-                elems.update(component.disp_beamcolumn_elements)
-        return elems
+        return self.cached_dict(
+            'disp_beamcolumn_elements',
+            lambda: merge_collections(
+                [component.disp_beamcolumn_elements
+                 for component in self.iter_components()]))
 
     def list_of_disp_beamcolumn_elements(self):
         """
         Returns a list of all DispBeamColumn objects in the model.
         """
-        return list(self.dict_of_disp_beamcolumn_elements().values())
+        return self.cached_list(
+            'disp_beamcolumn_elements',
+            lambda: [elm for component in self.iter_components()
+                     for elm in component.disp_beamcolumn_elements.values()])
 
-    def dict_of_beamcolumn_elements(self):
+    def dict_of_beamcolumn_elements(
+            self) -> dict[int, ElasticBeamColumn | DispBeamColumn]:
         """
         Returns a dictionary of all beamcolumn elements in the model.
         The keys are the uids of the objects.
         """
-        elems = {}
-        elems.update(self.dict_of_elastic_beamcolumn_elements())
-        elems.update(self.dict_of_disp_beamcolumn_elements())
-        return elems
+        def build():
+            res: dict[int, ElasticBeamColumn | DispBeamColumn] = {
+                **self.dict_of_elastic_beamcolumn_elements(),
+                **self.dict_of_disp_beamcolumn_elements()}
+            return res
+        return self.cached_dict('beamcolumn_elements', build)
+
+    def iter_beamcolumn_elements(
+            self) -> tuple[ElasticBeamColumn | DispBeamColumn, ...]:
+        """
+        Returns all beamcolumn elements in the model, without copying
+        the cached sequence. Used when the result is only iterated
+        over.
+        """
+        return self.cached_tuple(
+            'beamcolumn_elements',
+            lambda: (self.list_of_elastic_beamcolumn_elements()
+                     + self.list_of_disp_beamcolumn_elements()))
 
     def list_of_beamcolumn_elements(self):
         """
         Returns a list of all beamcolumn elements in the model.
         """
-        elems = []
-        elems.extend(self.list_of_elastic_beamcolumn_elements())
-        elems.extend(self.list_of_disp_beamcolumn_elements())
-        return elems
+        return list(self.iter_beamcolumn_elements())
 
-    def dict_of_zerolength_elements(self):
+    def dict_of_zerolength_elements(self) -> dict[int, ZeroLength]:
         """
         Returns a dictionary of all zerolength elements in the model.
         The keys are the uids of the objects.
         """
-        elems: dict[int, ZeroLength] = {}
-        for lvl in self.levels.values():
-            for component in lvl.components.values():
-                elems.update(component.zerolength_elements)
-        return elems
+        return self.cached_dict(
+            'zerolength_elements',
+            lambda: merge_collections(
+                [component.zerolength_elements
+                 for component in self.iter_components()]))
 
     def list_of_zerolength_elements(self):
         """
         Returns a list of all zerolength elements in the model.
         """
-        return list(self.dict_of_zerolength_elements().values())
+        return self.cached_list(
+            'zerolength_elements',
+            lambda: [elm for component in self.iter_components()
+                     for elm in component.zerolength_elements.values()])
 
-    def dict_of_twonodelink_elements(self):
+    def dict_of_twonodelink_elements(self) -> dict[int, TwoNodeLink]:
         """
         Returns a dictionary of all twonodelink elements in the model.
         The keys are the uids of the objects.
         """
-        elems: dict[int, TwoNodeLink] = {}
-        for lvl in self.levels.values():
-            for component in lvl.components.values():
-                elems.update(component.twonodelink_elements)
-        return elems
+        return self.cached_dict(
+            'twonodelink_elements',
+            lambda: merge_collections(
+                [component.twonodelink_elements
+                 for component in self.iter_components()]))
 
     def list_of_twonodelink_elements(self):
         """
         Returns a list of all twonodelink elements in the model.
         """
-        return list(self.dict_of_twonodelink_elements().values())
+        return self.cached_list(
+            'twonodelink_elements',
+            lambda: [elm for component in self.iter_components()
+                     for elm in component.twonodelink_elements.values()])
+
+    def primary_coords_array(self) -> nparr:
+        """
+        Returns the coordinates of all primary nodes of the model as
+        an (N, 3) array. The array is cached and only rebuilt after
+        the contents of some collection change.
+        """
+        version = collections.Collection.version
+        if self.coords_cache is None or self.coords_cache[0] != version:
+            self.coords_cache = (version, np.concatenate(
+                [np.empty((0, 3))]
+                + [lvl.nodes.coords_array()
+                   for lvl in self.levels.values()]))
+        return self.coords_cache[1]
 
     def bounding_box(self, padding: float) -> tuple[nparr, nparr]:
         """
         Returns the axis-aligned bouding box of the building
         """
-        p_min = np.full(3, np.inf)
-        p_max = np.full(3, -np.inf)
-        for node in self.list_of_primary_nodes():
-            point: nparr = np.array(node.coords)
-            p_min = np.minimum(p_min, point)
-            p_max = np.maximum(p_max, point)
-        p_min -= np.full(3, padding)
-        p_max += np.full(3, padding)
+        all_coords = self.primary_coords_array()
+        if len(all_coords):
+            p_min = np.min(all_coords, axis=0) - padding
+            p_max = np.max(all_coords, axis=0) + padding
+        else:
+            p_min = np.full(3, np.inf) - padding
+            p_max = np.full(3, -np.inf) + padding
         return p_min, p_max
 
     def reference_length(self):
@@ -346,7 +462,7 @@ class Model:
         (used in graphics)
         """
         p_min, p_max = self.bounding_box(padding=0.00)
-        ref_len = np.max(p_max - p_min)
+        ref_len = float(np.max(p_max - p_min))
         return ref_len
 
     def initialize_empty_copy(self, name):
@@ -378,17 +494,12 @@ class Model:
         the projection to the XY plane falls inside the specified
         polygon.
         """
-        all_components = self.list_of_components()
-        selected_components = []
-        shape = shapely_Polygon(coords)
-        for component in all_components:
-            accept = True
-            nodes = component.external_nodes.values()
-            for node in nodes:
-                if not shape.contains(Point(node.coords[0:2])):
-                    accept = False
-                    break
-            if accept:
-                selected_components.append(component)
+        # the polygon is tested against every external node, so it is
+        # prepared once up front
+        shape = prep(shapely_Polygon(coords))
+        selected_components = [
+            component for component in self.iter_components()
+            if all(shape.contains(Point(node.coords[0:2]))
+                   for node in component.external_nodes.values())]
         for component in selected_components:
             transfer_component(other, component)
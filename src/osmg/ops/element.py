@@ -11,7 +11,9 @@ Model Generator for OpenSees ~ element
 #
 # https://github.com/ioannis-vm/OpenSees_Model_Generator
 
+import math
 from dataclasses import dataclass, field
+from typing import Optional
 from typing import Union
 import numpy as np
 import numpy.typing as npt
@@ -21,6 +23,7 @@ from .section import ElasticSection
 from .section import FiberSection
 from ..graphics.visibility import ElementVisibility
 from .. import component_assembly
+from .. import transformations
 
 
 nparr = npt.NDArray[np.float64]
@@ -133,6 +136,18 @@ class GeomTransf:
     x_axis: nparr
     y_axis: nparr
     z_axis: nparr
+    transf_mat: Optional[nparr] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def glob_to_loc(self) -> nparr:
+        """
+        Returns the global to local transformation matrix.
+        The matrix is only computed once.
+        """
+        if self.transf_mat is None:
+            self.transf_mat = transformations.transformation_matrix(
+                self.x_axis, self.y_axis, self.z_axis)
+        return self.transf_mat
 
     def ops_args(self):
         """
@@ -184,9 +199,13 @@ class ElasticBeamColumn(Element):
         Returns the clear length of the element (without the rigid
         offsets)
         """
-        p_i = np.array(self.nodes[0].coords) + self.geomtransf.offset_i
-        p_j = np.array(self.nodes[1].coords) + self.geomtransf.offset_j
-        return np.linalg.norm(p_i - p_j)
+        n_i = self.nodes[0].coords
+        n_j = self.nodes[1].coords
+        o_i = self.geomtransf.offset_i
+        o_j = self.geomtransf.offset_j
+        return math.dist(
+            (n_i[0] + o_i[0], n_i[1] + o_i[1], n_i[2] + o_i[2]),
+            (n_j[0] + o_j[0], n_j[1] + o_j[1], n_j[2] + o_j[2]))
 
     def __repr__(self):
         res = ''
@@ -270,9 +289,13 @@ class DispBeamColumn(Element):
         Returns the clear length of the element (without the rigid
         offsets)
         """
-        p_i = np.array(self.nodes[0].coords) + self.geomtransf.offset_i
-        p_j = np.array(self.nodes[1].coords) + self.geomtransf.offset_j
-        return np.linalg.norm(p_i - p_j)
+        n_i = self.nodes[0].coords
+        n_j = self.nodes[1].coords
+        o_i = self.geomtransf.offset_i
+        o_j = self.geomtransf.offset_j
+        return math.dist(
+            (n_i[0] + o_i[0], n_i[1] + o_i[1], n_i[2] + o_i[2]),
+            (n_j[0] + o_j[0], n_j[1] + o_j[1], n_j[2] + o_j[2]))
 
     def __repr__(self):
         res = ''
@@ -289,3 +312,33 @@ class DispBeamColumn(Element):
         res += f'z_axis: {self.geomtransf.z_axis}\n'
         res += f'section.name: {self.section.name}\n'
         return res
+
+
+def end_points(
+        elms: list[Union[ElasticBeamColumn, DispBeamColumn]]
+) -> tuple[nparr, nparr]:
+    """
+    Returns the end points of the given line elements, including the
+    rigid offsets, packed in two contiguous (N, 3) arrays.
+    """
+    p_i: nparr = (
+        np.array([elm.nodes[0].coords for elm in elms], dtype=float)
+        + np.array([elm.geomtransf.offset_i for elm in elms], dtype=float)
+    ).reshape(-1, 3)
+    p_j: nparr = (
+        np.array([elm.nodes[1].coords for elm in elms], dtype=float)
+        + np.array([elm.geomtransf.offset_j for elm in elms], dtype=float)
+    ).reshape(-1, 3)
+    return p_i, p_j
+
+
+def clear_lengths(
+        elms: list[Union[ElasticBeamColumn, DispBeamColumn]]) -> nparr:
+    """
+    Returns the clear lengths of the given line elements (without
+    the rigid offsets), computed for all elements at once.
+    """
+    p_i, p_j = end_points(elms)
+    diff = p_j - p_i
+    lengths: nparr = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+    return lengths
@@ -12,12 +12,10 @@ Model Generator for OpenSees ~ node
 # https://github.com/ioannis-vm/OpenSees_Model_Generator
 
 from dataclasses import dataclass, field
-from functools import total_ordering
 from ..graphics.visibility import NodeVisibility
 
 
 @dataclass
-@total_ordering
 class Node:
     """
     OpenSees node
@@ -33,14 +31,38 @@ class Node:
     coords: list[float]
     restraint: list[bool] = field(init=False)
     visibility: NodeVisibility = field(default_factory=NodeVisibility)
+    mass: list[float] = field(init=False)
 
     def __post_init__(self):
         self.restraint = [False]*6
         self.mass = [0.00]*6
 
-    def __le__(self, other):
+    # Nodes are identified and ordered by their uid.
+    def __eq__(self, other):
+        if not isinstance(other, Node):
+            return NotImplemented
+        return self.uid == other.uid
+
+    def __ne__(self, other):
+        if not isinstance(other, Node):
+            return NotImplemented
+        return self.uid != other.uid
+
+    def __hash__(self):
+        return hash(self.uid)
+
+    def __lt__(self, other):
         return self.uid < other.uid
 
+    def __le__(self, other):
+        return self.uid <= other.uid
+
+    def __gt__(self, other):
+        return self.uid > other.uid
+
+    def __ge__(self, other):
+        return self.uid >= other.uid
+
     def __repr__(self):
         res = ''
         res += 'Node object\n'
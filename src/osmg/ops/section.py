@@ -121,6 +121,7 @@ class SectionComponent:
     ops_material: UniaxialMaterial
     physical_material: PhysicalMaterial
     parent_section: Optional[FiberSection] = field(default=None)
+    area: Optional[float] = field(default=None, init=False)
 
     def __repr__(self):
         res = ''
@@ -137,6 +138,19 @@ class SectionComponent:
         res += f'physical_material: {self.physical_material.name}\n'
         return res
 
+    def net_area(self) -> float:
+        """
+        Returns the area of the outside shape minus the area of the
+        holes. The shapes are not modified after they are defined, so
+        it is only computed once.
+        """
+        if self.area is None:
+            area = polygon_area(self.outside_shape.coords_array())
+            for hole in self.holes.values():
+                area -= polygon_area(hole.coords_array())
+            self.area = area
+        return self.area
+
     def cut_into_tiny_little_pieces(self):
         """
         Returns data used to define fibers in OpenSees
@@ -224,14 +238,7 @@ class FiberSection(Section):
             mult = 1.00
         res = 0.00
         for part in self.section_parts.values():
-            coords: nparr = np.array(
-                [h.vertex.coords for h in part.outside_shape.halfedges])
-            area = polygon_area(coords)
-            for hole in part.holes:
-                hole_coords: nparr = np.array(
-                    [h.vertex.coords
-                     for h in part.holes[hole].halfedges])
-                area -= polygon_area(hole_coords)
+            area = part.net_area()
             density = part.physical_material.density
             # TODO: units
             res += area * density * common.G_CONST_IMPERIAL
@@ -15,6 +15,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
 import numpy as np
+import numpy.typing as npt
 from ..ops.node import Node
 from .. import common
 from .. import load_case
@@ -22,6 +23,8 @@ if TYPE_CHECKING:
     from ..load_case import LoadCase
     from ..level import Level
 
+nparr = npt.NDArray[np.float64]
+
 
 @dataclass(repr=False)
 class RDAnalyzer:
@@ -46,18 +49,17 @@ class RDAnalyzer:
             nodes.extend(component.internal_nodes.values())
 
         # determine center of mass
-        masses = []
-        coords = []
-        for node in nodes:
-            mass = loadcase.node_mass[node.uid].val[0]
-            masses.append(mass)
-            coords.append(node.coords[0:2])
-        total_mass = sum(masses)
-        if np.abs(total_mass) <= common.EPSILON:
+        masses: nparr = np.array(
+            [loadcase.node_mass[node.uid].val[0] for node in nodes])
+        coords: nparr = np.concatenate(
+            [lvl.nodes.coords_array()]
+            + [component.internal_nodes.coords_array()
+               for component in lvl.components.values()])[:, 0:2]
+        total_mass = float(np.sum(masses))
+        if abs(total_mass) <= common.EPSILON:
             raise ValueError(
                 "Can't generate parent node without defined mass.")
-        coords_np = np.array(coords) * np.column_stack((masses, masses))
-        center = np.sum(coords_np/total_mass, axis=0)
+        center = masses @ coords / total_mass
         parent_node = Node(
             lvl.parent_model.uid_generator.new('node'),
             [*center, lvl.elevation])
@@ -68,16 +70,13 @@ class RDAnalyzer:
             load_case.PointLoadMass()
         if gather_mass:
             # gather all mass from the nodes of the level to the
-            # parent node
-            level_nodes: list[Node] = []
-            level_nodes.extend(lvl.nodes.values())
-            for comp in lvl.components.values():
-                level_nodes.extend(comp.internal_nodes.values())
-            for node in level_nodes:
-                mass = loadcase.node_mass[node.uid].val[0]
-                loadcase.node_mass[node.uid].val = np.zeros(6)
-                dist2 = np.linalg.norm(
-                    np.array(node.coords[0:2])
-                    - np.array(parent_node.coords[0:2]))**2
-                loadcase.node_mass[parent_node.uid].val += \
-                    np.array((mass, mass, 0.00, 0.00, 0.00, mass*dist2))
+            # parent node, reusing the mass and coordinate arrays
+            # computed above
+            dists = coords - center
+            dist2 = np.einsum('ij,ij->i', dists, dists)
+            total_inertia = float(masses @ dist2)
+            for node in nodes:
+                loadcase.node_mass[node.uid].val.fill(0.00)
+            parent_mass = loadcase.node_mass[parent_node.uid].val
+            parent_mass[:2] += total_mass
+            parent_mass[5] += total_inertia
@@ -12,55 +12,81 @@ Model Generator for OpenSees ~ self weight, self mass
 # https://github.com/ioannis-vm/OpenSees_Model_Generator
 
 import numpy as np
+import numpy.typing as npt
 from .. import common
+from ..ops.element import clear_lengths
+from ..load_case import add_glob_udls
+
+nparr = npt.NDArray[np.float64]
+
+
+def weights_per_length(elms) -> nparr:
+    """
+    Returns the weight per length of the sections of the given
+    elements. The weight of each distinct section is only computed
+    once.
+    """
+    section_weights: dict[int, float] = {}
+    res = np.empty(len(elms))
+    for i, elm in enumerate(elms):
+        key = id(elm.section)
+        weight_per_length = section_weights.get(key)
+        if weight_per_length is None:
+            weight_per_length = elm.section.weight_per_length()
+            section_weights[key] = weight_per_length
+        res[i] = weight_per_length
+    return res
 
 
 def self_weight(mdl, lcase, factor=1.00):
     """
     Assigns the structure's self weight to its members
     """
-    for elm in mdl.list_of_beamcolumn_elements():
+    udls = []
+    udl_vals = []
+    elms = mdl.iter_beamcolumn_elements()
+    for elm, weight_per_length in zip(elms, weights_per_length(elms)):
 
         # if mdl.settings.imperial_units:
         #     g_const = common.G_CONST_IMPERIAL
         # else:
         #     g_const = common.G_CONST_SI
 
-        weight_per_length = elm.section.weight_per_length()
         # apply weight as UDL
         if elm.visibility.skip_opensees_definition:
             # in that case apply its weight to the connecting nodes
             elm_len = elm.clear_length()
             elm_w = weight_per_length * elm_len * factor
-            lcase.node_loads[
-                elm.nodes[0].uid].add(
-                    [0.00, 0.00, -elm_w/2.00, 0.00, 0.00, 0.00])
-            lcase.node_loads[
-                elm.nodes[1].uid].add(
-                    [0.00, 0.00, -elm_w/2.00, 0.00, 0.00, 0.00])
+            lcase.node_loads[elm.nodes[0].uid].val[2] -= elm_w/2.00
+            lcase.node_loads[elm.nodes[1].uid].val[2] -= elm_w/2.00
         else:
-            lcase.line_element_udl[
-                elm.uid].add_glob(np.array(
-                    [0., 0., -weight_per_length*factor]))
+            udls.append(lcase.line_element_udl[elm.uid])
+            udl_vals.append([0., 0., -weight_per_length*factor])
+    add_glob_udls(udls, np.array(udl_vals))
 
 
 def self_mass(mdl, lcase):
     """
     Assigns the structure's self mass to its members
     """
-    for elm in mdl.list_of_beamcolumn_elements():
-
-        if mdl.settings.imperial_units:
-            g_const = common.G_CONST_IMPERIAL
-        else:
-            g_const = common.G_CONST_SI
+    if mdl.settings.imperial_units:
+        g_const = common.G_CONST_IMPERIAL
+    else:
+        g_const = common.G_CONST_SI
 
-        weight_per_length = elm.section.weight_per_length()
-        mass_per_length = weight_per_length / g_const
+    elms = mdl.iter_beamcolumn_elements()
+    if not elms:
+        return
+    # clear lengths of all elements, computed at once
+    lengths = clear_lengths(elms)
+    # accumulate the lumped mass of each node as a scalar and
+    # update the translational components once per node
+    half_masses = weights_per_length(elms) / g_const * lengths / 2.00
+    node_half_mass: dict[int, float] = {}
+    for elm, half_mass in zip(elms, half_masses):
         # apply lumped mass at the connecting nodes
-        half_mass = (mass_per_length *
-                     elm.clear_length() / 2.00)
-        lcase.node_mass[
-            elm.nodes[0].uid].add([half_mass]*3+[0.00]*3)
-        lcase.node_mass[
-            elm.nodes[1].uid].add([half_mass]*3+[0.00]*3)
+        for nd in (elm.nodes[0], elm.nodes[1]):
+            node_half_mass[nd.uid] = (
+                node_half_mass.get(nd.uid, 0.00) + half_mass)
+    for uid, mass in node_half_mass.items():
+        lcase.node_mass[uid].val[:3] += mass
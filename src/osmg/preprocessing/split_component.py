@@ -11,16 +11,62 @@ Model Generator for OpenSees ~ split component
 #
 # https://github.com/ioannis-vm/OpenSees_Model_Generator
 
+from typing import Union
 import numpy as np
-from ..line import Line
 from ..ops.element import ElasticBeamColumn
 from ..ops.element import DispBeamColumn
 from ..ops.element import GeomTransf
+from ..ops.element import end_points
 from ..ops.node import Node
-from .. import common
 from ..ops.element import Lobatto
 
 
+def split_element(component, model, elm, node_i, node_j,
+                  offset_i, offset_j):
+    """
+    Defines a line element of the same type, section and orientation
+    as the given element, connecting the given nodes with the given
+    rigid offsets, and adds it to the component.
+    """
+    prev_gtransf = elm.geomtransf
+    transf = GeomTransf(
+        prev_gtransf.transf_type,
+        model.uid_generator.new('transformation'),
+        offset_i,
+        offset_j,
+        prev_gtransf.x_axis,
+        prev_gtransf.y_axis,
+        prev_gtransf.z_axis
+    )
+    new_elm: Union[ElasticBeamColumn, DispBeamColumn]
+    if isinstance(elm, ElasticBeamColumn):
+        new_elm = ElasticBeamColumn(
+            component,
+            model.uid_generator.new('element'),
+            [node_i, node_j],
+            elm.section,
+            transf
+        )
+        component.elastic_beamcolumn_elements.add(new_elm)
+    else:
+        assert isinstance(elm.integration, Lobatto)
+        beam_integration = Lobatto(
+            uid=model.uid_generator.new('beam integration'),
+            parent_section=elm.section,
+            n_p=elm.integration.n_p
+        )
+        new_elm = DispBeamColumn(
+            component,
+            model.uid_generator.new('element'),
+            [node_i, node_j],
+            elm.section,
+            transf,
+            beam_integration
+        )
+        component.disp_beamcolumn_elements.add(new_elm)
+    return new_elm
+
+
 def split_component(component, point):
     """
     Splits a beam-functioning component assembly to
@@ -30,143 +76,62 @@ def split_component(component, point):
     elms = []
     elms.extend(component.elastic_beamcolumn_elements.values())
     elms.extend(component.disp_beamcolumn_elements.values())
-    distances = np.zeros(len(elms))
-    for i, elm in enumerate(elms):
-        p_i = (np.array(elm.nodes[0].coords)
-               + elm.geomtransf.offset_i)
-        p_j = (np.array(elm.nodes[1].coords)
-               + elm.geomtransf.offset_j)
-        line = Line('', p_i, p_j)
-        dist = line.point_distance(point)
-        distances[i] = dist
+    # distances of the point from all elements at once, using the
+    # packed end point arrays. Elements on which the projection of
+    # the point does not fall are excluded.
+    starts, ends = end_points(elms)
+    r_a = ends - starts
+    r_b = point - starts
+    proj_param = (np.einsum('ij,ij->i', r_b, r_a)
+                  / np.einsum('ij,ij->i', r_a, r_a))
+    # only the closest element is needed, so squared distances
+    # suffice
+    r_c = r_b - proj_param[:, np.newaxis] * r_a
+    distances = np.einsum('ij,ij->i', r_c, r_c)
+    distances[(proj_param < 0.00) | (proj_param > 1.00)] = np.inf
+    # zero-length elements result in nan
     np.nan_to_num(distances, copy=False, nan=np.inf)
     i_min = np.argmin(distances)
+    # the point has to project on at least one of the elements
+    assert np.isfinite(distances[i_min])
     closest_elm = elms[i_min]
-    p_i = (np.array(closest_elm.nodes[0].coords)
-           + closest_elm.geomtransf.offset_i)
-    p_j = (np.array(closest_elm.nodes[1].coords)
-           + closest_elm.geomtransf.offset_j)
-    line = Line('', p_i, p_j)
-    split_point = line.project(point)
-    assert split_point is not None  # check if it exists
+    # projection of the point on the closest element
+    split_point = starts[i_min] + proj_param[i_min] * r_a[i_min]
 
-    # first check if a node already exists there
-    inodes = component.internal_nodes.values()
-    for inode in inodes:
-        if np.linalg.norm(
-                np.array(inode.coords) - split_point) < common.EPSILON:
-            avail_node = inode
-            offset = point - np.array(avail_node.coords)
+    # first check if a node already exists there, either inside the
+    # component or at one of its ends
+    for nodes in (component.internal_nodes, component.external_nodes):
+        avail_node = nodes.search_point(split_point)
+        if avail_node is not None:
+            offset = point - avail_node.coords
             return avail_node, offset
 
     # otherwise:
 
-    # remove existing line element
-    node_i = closest_elm.nodes[0]
-    node_j = closest_elm.nodes[1]
-    prev_section = closest_elm.section
-    prev_gtransf = closest_elm.geomtransf
+    model = component.parent_collection.parent.parent_model
+
     if isinstance(closest_elm, ElasticBeamColumn):
-        component.elastic_beamcolumn_elements.pop(closest_elm.uid)
+        elms_collection = component.elastic_beamcolumn_elements
     elif isinstance(closest_elm, DispBeamColumn):
-        component.disp_beamcolumn_elements.pop(closest_elm.uid)
+        elms_collection = component.disp_beamcolumn_elements
     else:
         raise ValueError('Unsupported element type')
 
     # add split node
     middle_node = Node(
-        component.parent_collection.parent
-        .parent_model.uid_generator.new('node'),
-        list(split_point))
+        model.uid_generator.new('node'),
+        split_point.tolist())
     component.internal_nodes.add(middle_node)
-    # add two new line elements
-    # part i
-    o_i = prev_gtransf.offset_i
-    o_j = np.zeros(3)
-    n_i = node_i
-    n_j = middle_node
-    transf_i = GeomTransf(
-        prev_gtransf.transf_type,
-        component.parent_collection.parent.parent_model
-        .uid_generator.new('transformation'),
-        o_i,
-        o_j,
-        prev_gtransf.x_axis,
-        prev_gtransf.y_axis,
-        prev_gtransf.z_axis
-    )
-    if isinstance(closest_elm, ElasticBeamColumn):
-        elm_i = ElasticBeamColumn(
-            component,
-            component.parent_collection.parent.parent_model
-            .uid_generator.new('element'),
-            [n_i, n_j],
-            prev_section,
-            transf_i
-        )
-        component.elastic_beamcolumn_elements.add(elm_i)
-    elif isinstance(closest_elm, DispBeamColumn):
-        assert isinstance(closest_elm.integration, Lobatto)
-        beam_integration = Lobatto(
-            uid=component.parent_collection.parent.parent_model
-            .uid_generator.new('beam integration'),
-            parent_section=prev_section,
-            n_p=closest_elm.integration.n_p
-        )
-        elm_i = DispBeamColumn(  # type: ignore
-            component,
-            component.parent_collection.parent.parent_model
-            .uid_generator.new('element'),
-            [n_i, n_j],
-            prev_section,
-            transf_i,
-            beam_integration
-        )
-        component.disp_beamcolumn_elements.add(elm_i)
-    # part j
-    o_i = np.zeros(3)
-    o_j = prev_gtransf.offset_j
-    n_i = middle_node
-    n_j = node_j
-    transf_j = GeomTransf(
-        prev_gtransf.transf_type,
-        component.parent_collection.parent.parent_model
-        .uid_generator.new('transformation'),
-        o_i,
-        o_j,
-        prev_gtransf.x_axis,
-        prev_gtransf.y_axis,
-        prev_gtransf.z_axis
-    )
-    if isinstance(closest_elm, ElasticBeamColumn):
-        elm_j = ElasticBeamColumn(
-            component,
-            component.parent_collection.parent.parent_model
-            .uid_generator.new('element'),
-            [n_i, n_j],
-            prev_section,
-            transf_j
-        )
-        component.elastic_beamcolumn_elements.add(elm_j)
-    elif isinstance(closest_elm, DispBeamColumn):
-        assert isinstance(closest_elm.integration, Lobatto)
-        beam_integration = Lobatto(
-            uid=component.parent_collection.parent.parent_model.
-            uid_generator.new('beam integration'),
-            parent_section=prev_section,
-            n_p=closest_elm.integration.n_p
-        )
-        elm_j = DispBeamColumn(  # type: ignore
-            component,
-            component.parent_collection.parent.parent_model
-            .uid_generator.new('element'),
-            [n_i, n_j],
-            prev_section,
-            transf_j,
-            beam_integration
-        )
-        component.disp_beamcolumn_elements.add(elm_j)
+    # the existing element is shortened to become the part on the
+    # side of node i, and a new element is added for the part on the
+    # side of node j
+    node_i, node_j = closest_elm.nodes
+    offset_j = closest_elm.geomtransf.offset_j
+    elms_collection.reconnect(closest_elm, [node_i, middle_node])
+    closest_elm.geomtransf.offset_j = np.zeros(3)
+    split_element(component, model, closest_elm, middle_node, node_j,
+                  np.zeros(3), offset_j)
 
     # calculate offset and return
-    offset = point - np.array(middle_node.coords)
+    offset = point - split_point
     return middle_node, offset
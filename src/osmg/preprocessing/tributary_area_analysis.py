@@ -17,8 +17,8 @@ from typing import TYPE_CHECKING
 from typing import no_type_check
 from typing import Optional
 from dataclasses import dataclass, field
+import math
 import sys
-from tqdm import tqdm
 import numpy as np
 import numpy.typing as npt
 from .. import mesh
@@ -26,10 +26,12 @@ from ..ops.node import Node
 from .. import common
 from ..ops.element import ElasticBeamColumn
 from ..ops.element import DispBeamColumn
+from ..ops.element import clear_lengths
 if TYPE_CHECKING:
     from ..load_case import LoadCase
     from ..level import Level
-    from ..mesh import Edge, Vertex, Halfedge
+    from ..mesh import Edge, Vertex
+    from ..component_assembly import ComponentAssembly
 
 # pylint: disable=no-member
 # pylint: disable=import-outside-toplevel
@@ -110,6 +112,11 @@ class TributaryAreaAnaysis:
             analysis has verified that the checks are satisfied.
         """
 
+        # without surface loads there is nothing to distribute, so
+        # the (expensive) straight skeleton analysis is skipped
+        if all(load.value == 0.00 for load in self.polygon_loads):
+            return
+
         try:
             import skgeom as sg
         except ModuleNotFoundError:
@@ -123,16 +130,19 @@ class TributaryAreaAnaysis:
             print()
             print(msg)
             sys.exit()
+        from ..load_case import add_glob_udls
 
         lvl = self.parent_level
         all_components = list(lvl.components.values())
-        horizontal_elements = []
-        panel_zones = []
+        horizontal_elements: list[ComponentAssembly] = []
+        panel_zones: list[ComponentAssembly] = []
+        # group the components by their purpose with a single lookup
+        groups = {'horizontal_component': horizontal_elements,
+                  'steel_W_panel_zone': panel_zones}
         for component in all_components:
-            if component.component_purpose == 'horizontal_component':
-                horizontal_elements.append(component)
-            elif component.component_purpose == 'steel_W_panel_zone':
-                panel_zones.append(component)
+            group = groups.get(component.component_purpose)
+            if group is not None:
+                group.append(component)
 
         # # plotting - used while developing the code
         # subset_model = mdl.initialize_empty_copy('subset_1')
@@ -225,10 +235,11 @@ class TributaryAreaAnaysis:
                 else:
                     vrt_j = vertex_map[n_j.uid]
 
-                if np.linalg.norm(eo_i) >= common.EPSILON:
+                if math.hypot(*eo_i) >= common.EPSILON:
                     # there is a rigid offset and/or panel zone
-                    point = np.array(vrt_i.coords) + eo_i
-                    vrt_oi = mesh.Vertex((point[0], point[1]))
+                    vrt_oi = mesh.Vertex(
+                        (vrt_i.coords[0] + eo_i[0],
+                         vrt_i.coords[1] + eo_i[1]))
                     vertices[vrt_oi.uid] = vrt_oi
                     edg_oi = mesh.Edge(vrt_i, vrt_oi)
                     edges[edg_oi.uid] = edg_oi
@@ -236,11 +247,11 @@ class TributaryAreaAnaysis:
                     connecting_vertex_i = vrt_oi
                 else:
                     connecting_vertex_i = vrt_i
-                if np.linalg.norm(eo_j) >= common.EPSILON:
+                if math.hypot(*eo_j) >= common.EPSILON:
                     # there is a rigid offset and/or panel zone
-                    point = np.array(vrt_j.coords) + eo_j
                     vrt_oj = mesh.Vertex(
-                        (point[0], point[1]))
+                        (vrt_j.coords[0] + eo_j[0],
+                         vrt_j.coords[1] + eo_j[1]))
                     vertices[vrt_oj.uid] = vrt_oj
                     edg_oj = mesh.Edge(vrt_j, vrt_oj)
                     edges[edg_oj.uid] = edg_oj
@@ -283,29 +294,19 @@ class TributaryAreaAnaysis:
 
         if perform_checks:
             # verify that no edges overlap
-            all_edges_list = list(edges.values())
-            for index, considered_edge in enumerate(tqdm(
-                    all_edges_list,
-                    desc="Checking plan's edges",
-                    unit='edges'
-            )):
-                if index == len(all_edges_list):
-                    # we are done.
-                    continue
-                remaining_edges = all_edges_list[index+1::]
-                for other_edge in remaining_edges:
-                    # check if the two edges overlap or cross each other
-                    if considered_edge.overlaps_or_crosses(other_edge):
-                        # the two edges overlap or cross each other
-                        msg = "Error: Analysis of the floor plan geometry "
-                        msg += "indicates the presence of "
-                        msg += "overlapping elements.\n"
-                        msg += "Check the model at the following locations:\n"
-                        msg += f"{considered_edge.v_i.coords}"
-                        msg += f"{considered_edge.v_j.coords}"
-                        msg += f"{other_edge.v_i.coords}"
-                        msg += f"{other_edge.v_j.coords}"
-                        raise ValueError(msg)
+            overlapping = mesh.find_overlapping_edges(list(edges.values()))
+            if overlapping:
+                # the two edges overlap or cross each other
+                considered_edge, other_edge = overlapping
+                msg = "Error: Analysis of the floor plan geometry "
+                msg += "indicates the presence of "
+                msg += "overlapping elements.\n"
+                msg += "Check the model at the following locations:\n"
+                msg += f"{considered_edge.v_i.coords}"
+                msg += f"{considered_edge.v_j.coords}"
+                msg += f"{other_edge.v_i.coords}"
+                msg += f"{other_edge.v_j.coords}"
+                raise ValueError(msg)
 
         halfedges = mesh.define_halfedges(list(edges.values()))
         loops = mesh.obtain_closed_loops(halfedges)
@@ -323,62 +324,61 @@ class TributaryAreaAnaysis:
             # something like:
             # subloops = mesh.bisector_subdivision(internal_loop)
 
-            subloops: list[list[Halfedge]] = []
+            # coordinates of the vertices of each subloop
+            subloop_coords: list[list[tuple[float, float]]] = []
+            # (start, end) coordinates of the halfedges that are
+            # already part of some subloop
+            visited: set[tuple[tuple[float, float],
+                               tuple[float, float]]] = set()
 
-            def is_in_some_subloop(halfedge, loops):
-                for loop in loops:
-                    for other_halfedge in loop:
-                        if (other_halfedge.vertex.point ==
-                            halfedge.vertex.point and
-                                other_halfedge.next.vertex.point ==
-                                halfedge.next.vertex.point):
-                            return True
-                return False
+            def point_coords(point):
+                return (float(point.x()), float(point.y()))
 
             for halfedge in skel.halfedges:
-                if subloops:
-                    if is_in_some_subloop(halfedge, subloops):
-                        continue
+                if (point_coords(halfedge.vertex.point),
+                        point_coords(halfedge.next.vertex.point)) \
+                        in visited:
+                    continue
                 subloop = [halfedge]
                 nxt = halfedge.next
                 while nxt.vertex.point != halfedge.vertex.point:
                     subloop.append(nxt)
                     nxt = nxt.next
-                subloops.append(subloop)
+                coords = [point_coords(h.vertex.point) for h in subloop]
+                visited.update(zip(coords, coords[1:] + coords[:1]))
+                subloop_coords.append(coords)
 
-            subloop_areas = [float(sg.Polygon(
-                [h.vertex.point for h in subloop]).area())
-                for subloop in subloops]
+            subloop_areas = mesh.polygon_areas(
+                [np.array(coords) for coords in subloop_coords]).tolist()
             outer = min(subloop_areas)  # Remove the exterior loop
             index = subloop_areas.index(outer)
-            del subloops[index]
+            del subloop_coords[index]
             del subloop_areas[index]
 
-            for i, subloop in enumerate(subloops):
-                area = subloop_areas[i]
-                loop_edges = [h.edge for h in internal_loop]
-                for halfedge in subloop:
-                    for edge in loop_edges:
-                        v_i = sg.Point2(*edge.v_i.coords)
-                        v_j = sg.Point2(*edge.v_j.coords)
-                        pt_1 = halfedge.vertex.point
-                        pt_2 = halfedge.next.vertex.point
-                        if ((pt_1 == v_i and pt_2 == v_j) or
-                                (pt_1 == v_j and pt_2 == v_i)):
-                            if edge.uid in edge_area:
-                                edge_area[edge.uid] += area
-                            else:
-                                edge_area[edge.uid] = area
-                            if edge.uid in edge_polygons:
-                                edge_polygons[edge.uid].append(
-                                    [(float(h.vertex.point.x()),
-                                      float(h.vertex.point.y()))
-                                     for h in subloop])
-                            else:
-                                edge_polygons[edge.uid] = [
-                                    [(float(h.vertex.point.x()),
-                                      float(h.vertex.point.y()))
-                                     for h in subloop]]
+            # index the edges of the loop by their end points (in
+            # both directions), so that the edges corresponding to
+            # the halfedges of the subloops are found by lookup
+            # instead of comparing against every edge of the loop.
+            loop_edges: dict[tuple[tuple[float, float],
+                                   tuple[float, float]], list[Edge]] = {}
+            for h_loop in internal_loop:
+                edge = h_loop.edge
+                loop_edges.setdefault(
+                    (edge.v_i.coords, edge.v_j.coords), []).append(edge)
+                loop_edges.setdefault(
+                    (edge.v_j.coords, edge.v_i.coords), []).append(edge)
+
+            for coords, area in zip(subloop_coords, subloop_areas):
+                for key in zip(coords, coords[1:] + coords[:1]):
+                    for edge in loop_edges.get(key, ()):
+                        if edge.uid in edge_area:
+                            edge_area[edge.uid] += area
+                        else:
+                            edge_area[edge.uid] = area
+                        if edge.uid in edge_polygons:
+                            edge_polygons[edge.uid].append(list(coords))
+                        else:
+                            edge_polygons[edge.uid] = [list(coords)]
 
         # # plotting - used while developing the code
         # import pandas as pd
@@ -427,52 +427,42 @@ class TributaryAreaAnaysis:
         else:
             g_const = common.G_CONST_SI
         lcase = self.parent_loadcase
-        for uid, edge in edges.items():
+        # combine the polygon loads into a single surface load value
+        # (and the part of it that counts as a mass source)
+        surf_load = 0.00
+        surf_mass_load = 0.00
+        for load in self.polygon_loads:
+            if load.massless:
+                surf_load += load.value * massless_load_factor
+            else:
+                surf_load += load.value * load_factor
+                surf_mass_load += load.value
+        beams = []
+        beam_areas = []
+        for uid in edges:
             area = edge_area[uid]
             loaded_elm = edge_map[uid]
-            for load in self.polygon_loads:
-                if load.massless:
-                    cmult = massless_load_factor
-                else:
-                    cmult = load_factor
-                surf_load = load.value
-                load_val = surf_load * area
-                if isinstance(loaded_elm, Node):
-                    lcase.node_loads[
-                        loaded_elm.uid
-                    ].add(
-                        np.array([0.00, 0.00,
-                                  -load_val * cmult,
-                                  0.00, 0.00, 0.00])
-                    )
-                    if not load.massless:
-                        lcase.node_mass[
-                            loaded_elm.uid
-                        ].add(
-                            np.array([load_val/g_const,
-                                      load_val/g_const,
-                                      load_val/g_const,
-                                      0.00, 0.00, 0.00])
-                        )
-
-                elif isinstance(loaded_elm,
-                                (ElasticBeamColumn,
-                                 DispBeamColumn)):
-                    length = loaded_elm.clear_length()
-                    load_per_length = load_val / length
-                    udl_obj = lcase.line_element_udl[
-                        loaded_elm.uid
-                    ]
-                    udl_obj.add_glob(np.array(
-                        [0.00, 0.00, -load_per_length * cmult]))
-                    if not load.massless:
-                        half_mass = (load_val/2.00/g_const)
-                        lcase.node_mass[
-                            loaded_elm.nodes[0].uid].add(
-                                np.array([half_mass]*3+[0.00]*3))
-                        lcase.node_mass[
-                            loaded_elm.nodes[1].uid].add(
-                                np.array([half_mass]*3+[0.00]*3))
-
-                else:
-                    raise TypeError('This should never happen!')
+            if isinstance(loaded_elm, Node):
+                lcase.node_loads[loaded_elm.uid].val[2] -= (
+                    surf_load * area)
+                lcase.node_mass[loaded_elm.uid].val[:3] += (
+                    surf_mass_load * area / g_const)
+            elif isinstance(loaded_elm,
+                            (ElasticBeamColumn,
+                             DispBeamColumn)):
+                beams.append(loaded_elm)
+                beam_areas.append(area)
+            else:
+                raise TypeError('This should never happen!')
+        if beams:
+            # compute the UDLs of all loaded elements at once
+            areas = np.array(beam_areas)
+            udl_vals = np.zeros((len(beams), 3))
+            udl_vals[:, 2] = -surf_load * areas / clear_lengths(beams)
+            add_glob_udls(
+                [lcase.line_element_udl[elm.uid] for elm in beams],
+                udl_vals)
+            half_masses = surf_mass_load * areas / 2.00 / g_const
+            for elm, half_mass in zip(beams, half_masses):
+                lcase.node_mass[elm.nodes[0].uid].val[:3] += half_mass
+                lcase.node_mass[elm.nodes[1].uid].val[:3] += half_mass
@@ -21,6 +21,7 @@ from typing import Optional
 from typing import Any
 from typing import TYPE_CHECKING
 from dataclasses import dataclass, field
+import math
 import os
 import pickle
 import logging
@@ -282,7 +283,7 @@ class Analysis:
             if self.settings.specific_nodes:
                 node_uids.extend(self.settings.specific_nodes)
             else:
-                node_uids.extend(nd.uid for nd in self.mdl.list_of_all_nodes())
+                node_uids.extend(nd.uid for nd in self.mdl.iter_all_nodes())
                 node_uids.extend(
                     [n.uid for n in self.load_cases[case_name]
                      .parent_nodes.values()])
@@ -399,7 +400,7 @@ class Analysis:
         defined_sections: dict[int, object] = {}
         defined_materials: dict[int, object] = {}
 
-        elms = self.mdl.dict_of_disp_beamcolumn_elements().values()
+        disp_elms = self.mdl.dict_of_disp_beamcolumn_elements().values()
 
         def define_material(mat, defined_materials):
             """
@@ -417,8 +418,8 @@ class Analysis:
                 ops.uniaxialMaterial(*mat.ops_args())
                 defined_materials[mat.uid] = mat
 
-        for elm in elms:
-            sec = elm.section
+        for disp_elm in disp_elms:
+            sec = disp_elm.section
             parts = sec.section_parts.values()
             if sec.uid not in defined_sections:
                 ops.section(*sec.ops_args())
@@ -435,9 +436,10 @@ class Analysis:
                                   z_loc,
                                   area,
                                   part.ops_material.uid)
-            ops.beamIntegration(*elm.integration.ops_args())
-            ops.geomTransf(*elm.geomtransf.ops_args())
-            ops.element(*elm.ops_args())
+            ops.beamIntegration(
+                *disp_elm.integration.ops_args())  # type: ignore
+            ops.geomTransf(*disp_elm.geomtransf.ops_args())
+            ops.element(*disp_elm.ops_args())
 
         # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
         # ZeroLength element definition #
@@ -479,7 +481,7 @@ class Analysis:
     def _define_loads(self, case_name):
         ops.timeSeries('Linear', 1)
         ops.pattern('Plain', 1, 1)
-        for elm in self.mdl.list_of_beamcolumn_elements():
+        for elm in self.mdl.iter_beamcolumn_elements():
             if elm.visibility.skip_opensees_definition:
                 continue
             udl_total = (self.load_cases[case_name]
@@ -491,7 +493,7 @@ class Analysis:
                             udl_total[2],
                             udl_total[0])
 
-        for node in self.mdl.list_of_all_nodes():
+        for node in self.mdl.iter_all_nodes():
             ops.load(node.uid, *self.load_cases[case_name]
                      .node_loads[node.uid].val)
 
@@ -538,10 +540,7 @@ class Analysis:
             moments_global_ends = global_values[3:6]
             moments_global_clear = transformations.offset_transformation(
                 elm.geomtransf.offset_i, moments_global_ends, forces_global)
-            x_vec = elm.geomtransf.x_axis
-            y_vec = elm.geomtransf.y_axis
-            z_vec = elm.geomtransf.z_axis
-            transf_global2local: nparr = np.vstack((x_vec, y_vec, z_vec))
+            transf_global2local = elm.geomtransf.glob_to_loc()
             n_i, qy_i, qz_i = transf_global2local @ forces_global
             t_i, my_i, mz_i = transf_global2local @ moments_global_clear
             forces: nparr = np.array((n_i, qy_i, qz_i, t_i, my_i, mz_i))
@@ -748,14 +747,8 @@ class ModalAnalysis(Analysis):
                 u_j_o = transformations.offset_transformation(
                     offset_j, np.array(u_j), np.array(r_j))
 
-                x_vec = elm.geomtransf.x_axis
-                y_vec = elm.geomtransf.y_axis
-                z_vec: nparr = np.cross(x_vec, y_vec)
-
                 # global -> local transformation matrix
-                transf_global2local = \
-                    transformations.transformation_matrix(
-                        x_vec, y_vec, z_vec)
+                transf_global2local = elm.geomtransf.glob_to_loc()
                 u_i_local = transf_global2local @ u_i_o
                 r_i_local = transf_global2local @ r_i
                 u_j_local = transf_global2local @ u_j_o
@@ -767,7 +760,7 @@ class ModalAnalysis(Analysis):
                 # note: modal analsis doesn't account for applied loads.
                 # this will cause issues with plotting if loads
                 # have been applied.
-                if np.linalg.norm(udl) > common.EPSILON:
+                if math.hypot(*udl) > common.EPSILON:
                     raise ValueError('Loads applied at modal load case.')
 
                 # stiffness matrix terms
@@ -1514,13 +1507,13 @@ class NLTHAnalysis(NonlinearAnalysis):
 
         nss = []
         if filename_x:
-            gm_vals_x = np.genfromtxt(filename_x)
+            gm_vals_x = np.loadtxt(filename_x)
             nss.append(len(gm_vals_x))
         if filename_y:
-            gm_vals_y = np.genfromtxt(filename_y)
+            gm_vals_y = np.loadtxt(filename_y)
             nss.append(len(gm_vals_y))
         if filename_z:
-            gm_vals_z = np.genfromtxt(filename_z)
+            gm_vals_z = np.loadtxt(filename_z)
             nss.append(len(gm_vals_z))
 
         self.log(f'filename_x: {filename_x}')
@@ -11,6 +11,8 @@ Performs coordinate transformations
 #
 # https://github.com/ioannis-vm/OpenSees_Model_Generator
 
+from functools import lru_cache
+import math
 import numpy as np
 import numpy.typing as npt
 from . import common
@@ -89,7 +91,25 @@ def local_axes_from_points_and_angle(point_i: nparr,
     """
     # x
     x_axis = point_j - point_i
-    x_axis = x_axis / np.linalg.norm(x_axis)
+    x_axis = x_axis / math.hypot(*x_axis)
+    # elements sharing the same direction and angle share the same
+    # local axes, so they are only computed once.
+    axes = _local_axes_from_direction_and_angle(
+        (float(x_axis[0]), float(x_axis[1]), float(x_axis[2])),
+        float(ang))
+    return axes[0].copy(), axes[1].copy(), axes[2].copy()
+
+
+@lru_cache(maxsize=4096)
+def _local_axes_from_direction_and_angle(
+        x_dir: tuple[float, float, float],
+        ang: float) -> tuple[nparr, nparr, nparr]:
+    """
+    Obtain the local coordinate system of a linear element given its
+    unit x axis and its angle.
+    See `local_axes_from_points_and_angle`.
+    """
+    x_axis: nparr = np.array(x_dir)
     # y and z
     diff = np.abs(
         np.linalg.norm(x_axis - np.array([0.00, 0.00, -1.00])))
@@ -117,7 +137,7 @@ def local_axes_from_points_and_angle(point_i: nparr,
         # determine z axis from the cross-product
         z_axis = np.cross(x_axis, y_axis)
 
-    return x_axis, y_axis, z_axis  # type: ignore
+    return x_axis, y_axis, z_axis
 
 
 def offset_transformation(offset: nparr,
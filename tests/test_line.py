@@ -0,0 +1,79 @@
+"""
+Line Tests
+"""
+
+import numpy as np
+from osmg.line import Line
+
+
+def line(start, end):
+    """
+    Defines a line given its end points
+    """
+    return Line('', np.array(start), np.array(end))
+
+
+def test_intersect_inside():
+    """
+    Segments crossing at their interior
+    """
+    res = line((0.00, 0.00), (2.00, 2.00)).intersect(
+        line((0.00, 2.00), (2.00, 0.00)))
+    assert res is not None
+    assert np.allclose(res, (1.00, 1.00))
+    res = line((0.00, 0.00), (4.00, 0.00)).intersect(
+        line((1.00, -1.00), (1.00, 3.00)))
+    assert res is not None
+    assert np.allclose(res, (1.00, 0.00))
+
+
+def test_intersect_outside():
+    """
+    The lines passing through the segments intersect outside of
+    them
+    """
+    # outside of both segments
+    assert line((0.00, 0.00), (1.00, 0.00)).intersect(
+        line((2.00, 1.00), (2.00, 2.00))) is None
+    # outside of the first segment only
+    assert line((0.00, 0.00), (1.00, 0.00)).intersect(
+        line((2.00, -1.00), (2.00, 1.00))) is None
+    # outside of the second segment only
+    assert line((2.00, -1.00), (2.00, 1.00)).intersect(
+        line((0.00, 0.00), (1.00, 0.00))) is None
+
+
+def test_intersect_endpoints():
+    """
+    Segments touching at their end points
+    """
+    res = line((0.00, 0.00), (1.00, 0.00)).intersect(
+        line((1.00, 0.00), (1.00, 1.00)))
+    assert res is not None
+    assert np.allclose(res, (1.00, 0.00))
+    # end point of a segment on the interior of the other
+    res = line((0.00, 0.00), (2.00, 0.00)).intersect(
+        line((1.00, 0.00), (1.00, 1.00)))
+    assert res is not None
+    assert np.allclose(res, (1.00, 0.00))
+
+
+def test_intersect_parallel():
+    """
+    Parallel segments
+    """
+    # offset
+    assert line((0.00, 0.00), (1.00, 0.00)).intersect(
+        line((0.00, 1.00), (1.00, 1.00))) is None
+    # colinear, apart
+    assert line((0.00, 0.00), (1.00, 0.00)).intersect(
+        line((2.00, 0.00), (3.00, 0.00))) is None
+    # colinear, sharing an end point
+    res = line((0.00, 0.00), (1.00, 0.00)).intersect(
+        line((1.00, 0.00), (2.00, 0.00)))
+    assert res is not None
+    assert np.allclose(res, (1.00, 0.00))
+    res = line((1.00, 0.00), (0.00, 0.00)).intersect(
+        line((1.00, 0.00), (2.00, 0.00)))
+    assert res is not None
+    assert np.allclose(res, (1.00, 0.00))
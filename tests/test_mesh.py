@@ -0,0 +1,123 @@
+"""
+Mesh Tests
+"""
+
+from osmg.mesh import Vertex
+from osmg.mesh import Edge
+from osmg.mesh import find_overlapping_edges
+
+
+def define_edges(segments):
+    """
+    Defines edges from a list of segments given as pairs of
+    points. Segments sharing a point share the same vertex.
+    """
+    vertices = {}
+    edges = []
+    for point_i, point_j in segments:
+        for point in (point_i, point_j):
+            if point not in vertices:
+                vertices[point] = Vertex(point)
+        edges.append(Edge(vertices[point_i], vertices[point_j]))
+    return edges
+
+
+def brute_force(edges):
+    """
+    Checks all pairs of edges one by one
+    """
+    for i, edge in enumerate(edges):
+        for other_edge in edges[i+1:]:
+            if edge.overlaps_or_crosses(other_edge):
+                return True
+    return False
+
+
+def check(segments, expected):
+    """
+    Compares `find_overlapping_edges` against checking all pairs of
+    edges one by one
+    """
+    edges = define_edges(segments)
+    assert brute_force(edges) is expected
+    res = find_overlapping_edges(edges)
+    assert (res is not None) is expected
+    if res is not None:
+        edge, other_edge = res
+        assert edge.overlaps_or_crosses(other_edge)
+
+
+def test_crossing():
+    """
+    Edges crossing at their interior
+    """
+    check([((0.00, 0.00), (2.00, 2.00)),
+           ((0.00, 2.00), (2.00, 0.00))], True)
+    check([((0.00, 0.00), (4.00, 0.00)),
+           ((1.00, -1.00), (1.00, 3.00)),
+           ((5.00, 5.00), (6.00, 5.00))], True)
+
+
+def test_colinear_overlap():
+    """
+    Colinear edges sharing a segment
+    """
+    check([((0.00, 0.00), (2.00, 0.00)),
+           ((1.00, 0.00), (3.00, 0.00))], True)
+    check([((0.00, 0.00), (3.00, 3.00)),
+           ((1.00, 1.00), (2.00, 2.00))], True)
+    # the same edge defined twice
+    check([((0.00, 0.00), (2.00, 0.00)),
+           ((2.00, 0.00), (0.00, 0.00))], True)
+
+
+def test_colinear_touching():
+    """
+    Colinear edges sharing only an end point
+    """
+    check([((0.00, 0.00), (1.00, 0.00)),
+           ((1.00, 0.00), (2.00, 0.00))], False)
+    check([((0.00, 0.00), (0.00, 1.00)),
+           ((0.00, 1.00), (0.00, 2.00)),
+           ((0.00, 2.00), (0.00, 3.00))], False)
+
+
+def test_parallel_offset():
+    """
+    Parallel edges that are not colinear
+    """
+    check([((0.00, 0.00), (2.00, 0.00)),
+           ((0.00, 1.00), (2.00, 1.00))], False)
+    check([((0.00, 0.00), (2.00, 2.00)),
+           ((1.00, 0.00), (3.00, 2.00))], False)
+
+
+def test_t_junction():
+    """
+    The end point of an edge on the interior of another edge
+    """
+    check([((0.00, 0.00), (2.00, 0.00)),
+           ((1.00, 0.00), (1.00, 1.00))], False)
+    check([((0.00, 0.00), (0.00, 2.00)),
+           ((0.00, 1.00), (1.00, 1.00)),
+           ((1.00, 1.00), (1.00, 2.00))], False)
+
+
+def test_grid():
+    """
+    The edges of a grid of squares only share vertices
+    """
+    segments = []
+    for i in range(4):
+        for j in range(4):
+            if i < 3:
+                segments.append(((float(i), float(j)),
+                                 (float(i + 1), float(j))))
+            if j < 3:
+                segments.append(((float(i), float(j)),
+                                 (float(i), float(j + 1))))
+    check(segments, False)
+    # adding a diagonal across a square does not cause overlaps
+    check(segments + [((0.00, 0.00), (1.00, 1.00))], False)
+    # but adding one across two squares does
+    check(segments + [((0.00, 0.00), (2.00, 1.00))], True)